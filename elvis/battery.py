@@ -1,23 +1,68 @@
-from elvis.utility.elvis_general import floor
+import operator
+
+import numpy as np
+
 from elvis.units import Energy
 from elvis.units import Power
 
 
+def _max_discharge_power(soc, min_soc, capacity, max_power, cur_ass_power, step_hours):
+    """Max power a battery can be discharged with during one time step regarding its power
+        limits, the already assigned power and its current energy level.
+        Scalar kernel of :meth: `StationaryBattery.max_discharge_power`."""
+    # Max power based on already assigned power and what is theoretically possible to discharge
+    max_power_theo = max_power - cur_ass_power
+
+    # Power that leads to SOC = min_soc at the end of time step
+    soc_cur_ass_power = cur_ass_power / capacity * step_hours
+    power_to_empty = (soc - soc_cur_ass_power - min_soc) * capacity / step_hours
+
+    # Max power possible based on energy level and power limits. Conditional expressions
+    # instead of min/max: no call and argument tuple per time step
+    max_power = max_power_theo if max_power_theo < power_to_empty else power_to_empty
+    return max_power if max_power > 0 else 0
+
+
+def _charge_power(soc, capacity, max_power, available_power, step_hours):
+    """Power a battery can be charged with during one time step regarding the available power,
+        its power limits and its current energy level.
+        Scalar kernel of :meth: `StationaryBattery.charge`."""
+    power = available_power if available_power < max_power else max_power
+    # Power needed to charge to SOC = 1 at the end of time step
+    power_to_full = (1 - soc) * capacity / step_hours
+    return power if power < power_to_full else power_to_full
+
+
 class Battery:
     """Models a generic battery."""
 
+    __slots__ = ('capacity', 'max_charge_power', 'min_charge_power', 'efficiency',
+                 'start_power_degradation', 'max_degradation_level', '_degradation_slope',
+                 'inv_capacity', '_dict')
+
+    # Parameters describing the battery. They are not supposed to change after __init__.
+    STATE_FIELDS = __slots__[:6]
+    # Returns the values of STATE_FIELDS as a tuple
+    _state = operator.attrgetter(*STATE_FIELDS)
+
+    # Keys from_dict can not do without
+    _REQUIRED_KEYS = frozenset(('capacity', 'max_charge_power', 'min_charge_power', 'efficiency'))
+
     def __init__(self, capacity: Energy, max_charge_power: Power,
                  min_charge_power: Power, efficiency: float, start_power_degradation: float=1,
                  max_degradation_level: float=0):
         """Create instance of Battery given all parameters."""
-        assert isinstance(capacity, (float, int)) and capacity > 0, \
-            'Battery capacity must be greater than 0'
-        assert isinstance(max_charge_power, (float, int))
-        assert isinstance(min_charge_power, (float, int))
-        assert isinstance(efficiency, (float, int)) and (0 <= efficiency <= 1)
-        assert isinstance(start_power_degradation, (float, int)) and (0 <= start_power_degradation <= 1)
-        assert isinstance(max_degradation_level, (float, int)) and (0 <= max_degradation_level <= 1)
-        assert max_degradation_level * max_charge_power >= min_charge_power
+        numeric = (float, int)
+        assert isinstance(capacity, numeric) and capacity > 0 and \
+            isinstance(max_charge_power, numeric) and isinstance(min_charge_power, numeric) and \
+            isinstance(efficiency, numeric) and 0 <= efficiency <= 1 and \
+            isinstance(start_power_degradation, numeric) and \
+            0 <= start_power_degradation <= 1 and \
+            isinstance(max_degradation_level, numeric) and 0 <= max_degradation_level <= 1 and \
+            max_degradation_level * max_charge_power >= min_charge_power, \
+            'Invalid battery parameters. All must be numeric with: capacity > 0, ' \
+            'efficiency, start_power_degradation and max_degradation_level in [0, 1] and ' \
+            'max_degradation_level * max_charge_power >= min_charge_power.'
 
         # battery capacity (kWh)
         self.capacity = capacity
@@ -39,9 +84,43 @@ class Battery:
         # max_power_possible * max_degradation_level
         self.max_degradation_level = max_degradation_level
 
+        # Power lost per SOC above start_power_degradation. Derived once from the fixed
+        # parameters so max_power_possible is a single multiply-subtract
+        self._degradation_slope = Battery._power_degradation_slope(
+            max_charge_power, start_power_degradation, max_degradation_level)
+
+        # 1 / capacity, so charging per time step multiplies instead of divides
+        self.inv_capacity = 1 / capacity
+
+        # Cache of to_dict, created on first use
+        self._dict = None
+
+    def __getstate__(self):
+        return self._state(self)
+
+    def __setstate__(self, state):
+        for key, value in zip(self.STATE_FIELDS, state):
+            setattr(self, key, value)
+        self._degradation_slope = Battery._power_degradation_slope(
+            self.max_charge_power, self.start_power_degradation, self.max_degradation_level)
+        self.inv_capacity = 1 / self.capacity
+        self._dict = None
+
+    @staticmethod
+    def _power_degradation_slope(max_charge_power, start_power_degradation,
+                                 max_degradation_level):
+        """Slope of the linear power degradation between start_power_degradation and SOC = 1.
+            0 if the battery does not degrade."""
+        if start_power_degradation >= 1:
+            return 0
+        return max_charge_power * (1 - max_degradation_level) / (1 - start_power_degradation)
+
     def to_dict(self):
-        dictionary = self.__dict__.copy()
-        return dictionary
+        """Returns the battery parameters as a dict. The dict is only built once per battery
+            since the parameters do not change after initialisation; a copy is returned."""
+        if self._dict is None:
+            self._dict = dict(zip(Battery.STATE_FIELDS, Battery._state(self)))
+        return self._dict.copy()
 
     def max_power_possible(self, current_soc):
         """Return the max power that can be assigned to the battery in regard of the current
@@ -57,15 +136,39 @@ class Battery:
 
         """
         if current_soc > self.start_power_degradation:
-            power_degradation = (current_soc - self.start_power_degradation) / \
-                                (1-self.start_power_degradation) * \
-                                 self.max_charge_power * (1 - self.max_degradation_level)
-
-            max_power_possible = self.max_charge_power - power_degradation
-            return max_power_possible
+            return self.max_charge_power - \
+                (current_soc - self.start_power_degradation) * self._degradation_slope
 
         return self.max_charge_power
 
+    @staticmethod
+    def max_power_possible_vec(socs, max_charge_power, start_power_degradation,
+                               max_degradation_level):
+        """Vectorised version of max_power_possible to evaluate the SOC dependent power
+            degradation of many batteries at once. All arguments are broadcast against each other.
+
+        Args:
+            socs: (array_like): Current states of charge: [0, 1]
+            max_charge_power: (array_like): Maximum supported charging power of each battery.
+            start_power_degradation: (array_like): SOC level at which the max power starts
+                degrading.
+            max_degradation_level: (array_like): Remaining fraction of max_charge_power at SOC = 1.
+
+        Return:
+            max_power_possible: (:obj: `numpy.ndarray`): Max assignable power of each battery.
+        """
+        socs = np.asarray(socs, dtype=np.float64)
+        max_charge_power = np.asarray(max_charge_power, dtype=np.float64)
+        start_power_degradation = np.asarray(start_power_degradation, dtype=np.float64)
+        max_degradation_level = np.asarray(max_degradation_level, dtype=np.float64)
+
+        # Batteries with start_power_degradation = 1 never degrade: avoid dividing by 0
+        degradation_span = np.where(start_power_degradation < 1, 1 - start_power_degradation, 1)
+        degradation = np.maximum(socs - start_power_degradation, 0) / degradation_span
+        power_degradation = degradation * max_charge_power * (1 - max_degradation_level)
+
+        return max_charge_power - power_degradation
+
     def min_power_possible(self, current_soc):
         """Return the min power that can be assigned to the battery in regard of the current
         SOC.
@@ -89,31 +192,23 @@ class Battery:
             **kwargs: Arbitrary keyword arguments.
         """
 
-        necessary_keys = ['capacity', 'max_charge_power', 'min_charge_power', 'efficiency']
-
-        for key in necessary_keys:
-            assert key in kwargs, 'Not all necessary keys are included to create an EVBattery ' \
-                                  'from dict. Missing: ' + key
-
-        capacity = kwargs['capacity']
-        max_charge_power = kwargs['max_charge_power']
-        min_charge_power = kwargs['min_charge_power']
+        assert Battery._REQUIRED_KEYS <= kwargs.keys(), \
+            'Not all necessary keys are included to create an EVBattery from dict. Missing: ' + \
+            ', '.join(sorted(Battery._REQUIRED_KEYS - kwargs.keys()))
 
-        efficiency = kwargs['efficiency']
+        # Degradation parameters are optional, the defaults of __init__ are used otherwise
+        degradation = {key: kwargs[key] for key in ('start_power_degradation',
+                                                    'max_degradation_level') if key in kwargs}
 
-        if 'start_power_degradation' and 'max_degradation_level' in kwargs:
-            start_power_degradation = kwargs['start_power_degradation']
-            max_degradation_level = kwargs['max_degradation_level']
-
-            return EVBattery(capacity, max_charge_power, min_charge_power, efficiency,
-                             start_power_degradation, max_degradation_level)
-
-        return EVBattery(capacity, max_charge_power, min_charge_power, efficiency)
+        return EVBattery(kwargs['capacity'], kwargs['max_charge_power'],
+                         kwargs['min_charge_power'], kwargs['efficiency'], **degradation)
 
 
 class EVBattery(Battery):
     """Models an electric vehicle battery."""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(EVBattery, self).__init__(*args, **kwargs)
 
@@ -121,6 +216,11 @@ class EVBattery(Battery):
 class StationaryBattery(Battery):
     """Models a stationary vehicle battery."""
 
+    __slots__ = ('soc', 'min_soc', 'power', 'soc_time', '_t', '_step_h')
+
+    STATE_FIELDS = Battery.STATE_FIELDS + __slots__
+    _state = operator.attrgetter(*STATE_FIELDS)
+
     def __init__(self, *args, **kwargs):
 
         keys = kwargs.keys()
@@ -140,18 +240,69 @@ class StationaryBattery(Battery):
             self.min_soc = 0
 
         self.power = 0
-        self.soc_time = []
+        # SOC after each (dis)charging step. Preallocated via allocate, _t is the next position
+        self.soc_time = np.empty(0)
+        self._t = 0
+        # Length of a time step in hours, set once per simulation via set_step_hours
+        self._step_h = None
 
         super(StationaryBattery, self).__init__(*args, **kwargs)
 
-    def max_discharge_power(self, cur_ass_power, step_length):
+    def to_dict(self):
+        dictionary = super(StationaryBattery, self).to_dict()
+        dictionary['soc'] = self.soc
+        dictionary['min_soc'] = self.min_soc
+        dictionary['power'] = self.power
+        dictionary['soc_time'] = self.soc_history()
+        return dictionary
+
+    def allocate(self, n_steps):
+        """Preallocates the SOC log for a simulation and resets its position.
+
+        Args:
+            n_steps: (int): Number of time steps the battery will be (dis)charged.
+        """
+        self.soc_time = np.empty(n_steps, dtype=np.float64)
+        self._t = 0
+
+    def set_step_hours(self, step_hours):
+        """Sets the length of the time steps the battery is (dis)charged for. Used whenever
+            no step_length is passed to the (dis)charging methods.
+
+        Args:
+            step_hours: (float): Resolution of the simulation in hours.
+        """
+        assert step_hours > 0, 'The step length must be > 0.'
+        self._step_h = step_hours
+
+    def _step_hours(self, step_length):
+        """Returns the length of a time step in hours, preferring the passed step_length."""
+        if step_length is not None:
+            return step_length.total_seconds() / 3600
+        assert self._step_h is not None, 'Either pass step_length or call set_step_hours first.'
+        return self._step_h
+
+    def soc_history(self):
+        """Returns the logged SOCs of all (dis)charging steps so far as a list."""
+        return self.soc_time[:self._t].tolist()
+
+    def log_soc(self):
+        """Writes the current SOC to the next position of the SOC log. If the log is full
+            (e.g. if it has not been allocated) its size is doubled."""
+        if self._t == len(self.soc_time):
+            self.soc_time = np.concatenate((self.soc_time, np.empty(max(self._t, 1))))
+        self.soc_time[self._t] = self.soc
+        self._t += 1
+
+    def max_discharge_power(self, cur_ass_power, step_length=None):
         """Calculates the max power possible to discharge the storage system regarding its power
             limits and its current energy level.
 
         Args:
             cur_ass_power: (float): Currently assigned power.
             step_length: (:obj: `datetime.timedelta`): Resolution of the simulation denoting the
-                time in between two adjacent time steps.
+                time in between two adjacent time steps. If None the step length set by
+                set_step_hours is used.
 
         Returns:
             max_power: (float): Max power possible to discharge the storage system with.
@@ -159,23 +310,11 @@ class StationaryBattery(Battery):
         TODO:
             - integrate efficiencies
         """
-        assert isinstance(cur_ass_power, (float, int)), 'Currently assigned power should be numeric'
-        # Max power based on already assigned power and what is theoretically possible to discharge
-        max_power_theo = self.max_charge_power - cur_ass_power
-
-        # Power that leads to SOC = min_soc at the end of time step
-        step_length_hours = step_length.total_seconds() / 3600
-        soc_cur_ass_power = cur_ass_power / self.capacity * step_length_hours
-        power_to_empty = (self.soc - soc_cur_ass_power - self.min_soc) * \
-                         self.capacity / step_length_hours
-
-        # Max power possible based on energy level and power limits
-        max_power = max(min(max_power_theo, power_to_empty), 0)
-        # Round down to 3 decimals
-        max_power = floor(max_power)
-        return max_power
-
-    def charge(self, available_power, step_length):
+        step_length_hours = self._step_hours(step_length)
+        return _max_discharge_power(self.soc, self.min_soc, self.capacity, self.max_charge_power,
+                                    cur_ass_power, step_length_hours)
+
+    def charge(self, available_power, step_length=None):
         """
         Charges the battery with a given power or with whatever is possible considering its
             power limits and its current energy level.
@@ -183,7 +322,8 @@ class StationaryBattery(Battery):
         Args:
             available_power: (float): Power that is available from the transformer.
             step_length: (:obj: `datetime.timedelta`): Resolution of the simulation denoting the
-                time in between two adjacent time steps.
+                time in between two adjacent time steps. If None the step length set by
+                set_step_hours is used.
 
         Returns:
             power_charged: The power the battery was actually charged with.
@@ -191,25 +331,29 @@ class StationaryBattery(Battery):
         TODO:
             - integrate efficiencies
         """
-        assert isinstance(available_power, (float, int)), 'Available power should be numeric'
         assert available_power >= 0, 'The max charge power must be >= 0.'
-        # Power needed to charge to SOC = 1 at the end of time step
-        step_length_hours = step_length.total_seconds() / 3600
-        max_power_to_full = (1 - self.soc) * self.capacity / step_length_hours
+        # Nothing to charge with or nothing to charge: SOC stays the same
+        if available_power == 0 or self.soc >= 1:
+            self.power = 0
+            self.log_soc()
+            return 0
 
         # Max power possible considering all limits (available, power limits, energy level)
-        power_charged = min(max_power_to_full, self.max_charge_power, available_power)
-
-        # SOC change given the power to charge with
-        delta_soc = power_charged * step_length_hours / self.capacity
-        self.soc += delta_soc
+        step_length_hours = self._step_hours(step_length)
+        power_charged = _charge_power(self.soc, self.capacity, self.max_charge_power,
+                                      available_power, step_length_hours)
+
+        # SOC change given the power to charge with. The power limit keeps the SOC <= 1, the
+        # clamp only removes floating point round-off
+        soc = self.soc + power_charged * step_length_hours / self.capacity
+        self.soc = soc if soc < 1 else 1
         # Make sure SOC is within limits
         self.check_soc()
         self.power = power_charged
-        self.soc_time.append(self.soc)
+        self.log_soc()
         return power_charged
 
-    def discharge(self, power_to_discharge, step_length):
+    def discharge(self, power_to_discharge, step_length=None):
         """
         Tries to discharge the battery with given power. If either the power limits or the limit
             due to the current energy level is violated a ValueError will be raised.
@@ -218,14 +362,18 @@ class StationaryBattery(Battery):
             power_to_discharge: (float): Power the system is supposed to be discharged with.
                 Only positive values are allowed. These are understood to be discharged though.
             step_length: (:obj: `datetime.timedelta`): Resolution of the simulation denoting the
-                time in between two adjacent time steps.
+                time in between two adjacent time steps. If None the step length set by
+                set_step_hours is used.
 
         TODO:
             - integrate efficiencies
             """
-        assert isinstance(power_to_discharge,(float, int)), 'Currently assigned power ' \
-                                                            'should be numeric'
         assert power_to_discharge >= 0, 'The max charge power must be >= 0.'
+        # Idle step, always within the limits (also if the SOC is at min_soc already)
+        if power_to_discharge == 0:
+            self.power = 0
+            self.log_soc()
+            return
 
         # Max power too discharge with at current SOC
         max_discharge_power = self.max_discharge_power(0, step_length)
@@ -234,14 +382,48 @@ class StationaryBattery(Battery):
             raise ValueError('Power to discharge with is out of the limits.')
         self.power = - power_to_discharge
 
-        # SOC change given the power to discharge with
-        step_length_hours = step_length.total_seconds() / 3600
-        delta_soc = power_to_discharge * step_length_hours / self.capacity
-        self.soc -= delta_soc
+        # SOC change given the power to discharge with. The power limit keeps the SOC >= min_soc,
+        # the clamp only removes floating point round-off
+        step_length_hours = self._step_hours(step_length)
+        soc = self.soc - power_to_discharge * step_length_hours / self.capacity
+        self.soc = soc if soc > self.min_soc else self.min_soc
         # Make sure SOC is within limits
         self.check_soc()
-        self.soc_time.append(self.soc)
+        self.log_soc()
         return
 
+    def simulate_trace(self, power_trace, step_hours=None):
+        """Calculates the SOC after each time step for a known power trace, starting at the
+            current SOC. The battery itself is not changed. The SOC is kept within
+            [min_soc, 1]; power limits are not applied.
+
+        Args:
+            power_trace: (array_like): Power per time step. Positive values charge the battery,
+                negative values discharge it.
+            step_hours: (float): Length of a time step in hours. If None the step length set by
+                set_step_hours is used.
+
+        Returns:
+            soc_trace: (:obj: `numpy.ndarray`): SOC at the end of each time step.
+        """
+        if step_hours is None:
+            step_hours = self._step_hours(None)
+        delta_soc = np.asarray(power_trace, dtype=np.float64) * step_hours / self.capacity
+
+        # Without saturation every SOC is the running sum of the SOC changes
+        soc_trace = self.soc + np.cumsum(delta_soc)
+        out_of_limits = (soc_trace < self.min_soc) | (soc_trace > 1)
+        if not out_of_limits.any():
+            return soc_trace
+
+        # Clipping couples the steps: continue step by step from the first saturated step
+        first = int(np.argmax(out_of_limits))
+        soc = soc_trace[first - 1] if first > 0 else self.soc
+        for t in range(first, len(soc_trace)):
+            soc = min(max(soc + delta_soc[t], self.min_soc), 1)
+            soc_trace[t] = soc
+
+        return soc_trace
+
     def check_soc(self):
         assert 0 <= self.soc <= 1, 'SOC is out of limits.'
@@ -3,17 +3,34 @@
 - parking time: The time the car parks at the infrastructure before it is being driven away.
 - """
 import datetime
+import itertools
+import operator
 
+import numpy as np
 
 from elvis.vehicle import ElectricVehicle
 
 
 class ChargingEvent:
-    # static field incremented by 1 for every __init__
-    counter = 1
     """This class contains relevant parameters to describe a charging event.
     """
-    def __init__(self, arrival_time, parking_time, soc, vehicle_type):
+    __slots__ = ('_idx', 'arrival_time', 'parking_time', 'leaving_time', 'soc', 'soc_target',
+                 'vehicle_type')
+
+    STATE_FIELDS = __slots__
+    # Returns the values of STATE_FIELDS as a tuple
+    _state = operator.attrgetter(*STATE_FIELDS)
+    # Same as STATE_FIELDS but with the formatted id instead of its number
+    _DICT_FIELDS = ('id',) + STATE_FIELDS[1:]
+    _dict_state = operator.attrgetter(*_DICT_FIELDS)
+
+    # Keys from_dict can not do without
+    _REQUIRED_KEYS = frozenset(('arrival_time', 'parking_time', 'soc', 'vehicle_type'))
+
+    # static id generator, advanced by 1 for every __init__
+    counter = itertools.count(1)
+
+    def __init__(self, arrival_time, parking_time, soc, vehicle_type, leaving_time=None):
         """
 
         Args:
@@ -23,30 +40,42 @@ class ChargingEvent:
             soc: (float): SOC of the vehicle at arrival.
             vehicle_type: (:obj: `elvis.vehicle.VehicleType`): Instance of the vehicle describing
                 class VehicleType.
+            leaving_time: (datetime.datetime): Date and time the vehicle leaves the
+                infrastructure. If None it is calculated from arrival_time and parking_time.
         """
         assert isinstance(arrival_time, datetime.datetime)
         assert isinstance(parking_time, (float, int))
         assert isinstance(soc, (float, int)) and (0 <= soc <= 1.0)
         assert isinstance(vehicle_type, ElectricVehicle)
 
-        self.id = 'Charging event: ' + str(ChargingEvent.counter)
-        ChargingEvent.counter += 1
+        self._idx = next(ChargingEvent.counter)
         self.arrival_time = arrival_time
         self.parking_time = parking_time
-        self.leaving_time = self.arrival_time + datetime.timedelta(hours=self.parking_time)
+        if leaving_time is None:
+            # Positional seconds skip the keyword normalisation of timedelta(hours=...)
+            leaving_time = self.arrival_time + datetime.timedelta(0, self.parking_time * 3600)
+        self.leaving_time = leaving_time
         self.soc = soc
         self.soc_target = 1.0
         self.vehicle_type = vehicle_type
 
+    @property
+    def id(self):
+        """str: Unique identification. Only formatted when it is asked for."""
+        return 'Charging event: ' + str(self._idx)
+
     def __str__(self):
-        print_out = self.id + ', '
-        print_out += 'Arrival time: ' + str(self.arrival_time) + ', '
-        print_out += 'Parking_time: ' + str(self.parking_time) + ', '
-        print_out += 'Leaving_time: ' + str(self.leaving_time) + ', '
-        print_out += 'SOC: ' + str(self.soc) + ', '
-        print_out += 'SOC target: ' + str(self.soc_target) + ', '
-        print_out += 'Connected car: ' + str(self.vehicle_type)
-        return print_out
+        return f'{self.id}, Arrival time: {self.arrival_time}, ' \
+               f'Parking_time: {self.parking_time}, Leaving_time: {self.leaving_time}, ' \
+               f'SOC: {self.soc}, SOC target: {self.soc_target}, ' \
+               f'Connected car: {self.vehicle_type}'
+
+    def __getstate__(self):
+        return ChargingEvent._state(self)
+
+    def __setstate__(self, state):
+        for key, value in zip(ChargingEvent.STATE_FIELDS, state):
+            setattr(self, key, value)
 
     def to_dict(self, deep=True):
         """Transforms the an instance of ChargingEvent into a dict.
@@ -61,7 +90,7 @@ class ChargingEvent:
             dictionary: (dict): Var names as keys.
 
         """
-        dictionary = self.__dict__.copy()
+        dictionary = dict(zip(ChargingEvent._DICT_FIELDS, ChargingEvent._dict_state(self)))
 
         dictionary['arrival_time'] = str(self.arrival_time.isoformat())
         dictionary['soc'] = self.soc
@@ -83,15 +112,90 @@ class ChargingEvent:
             **kwargs: Arbitrary keyword arguments.
         """
 
-        necessary_keys = ['arrival_time', 'parking_time', 'soc', 'vehicle_type']
-
-        for key in necessary_keys:
-            assert key in kwargs, 'Not all necessary keys are included to create a ChargingEvent ' \
-                                  'from dict.'
+        assert ChargingEvent._REQUIRED_KEYS <= kwargs.keys(), \
+            'Not all necessary keys are included to create a ChargingEvent from dict. ' \
+            'Missing: ' + ', '.join(sorted(ChargingEvent._REQUIRED_KEYS - kwargs.keys()))
 
         arrival_time = kwargs['arrival_time']
+        # to_dict stores the arrival time as ISO string
+        if isinstance(arrival_time, str):
+            arrival_time = datetime.datetime.fromisoformat(arrival_time)
         parking_time = kwargs['parking_time']
         soc = kwargs['soc']
-        vehicle_type = ElectricVehicle.from_dict(**kwargs['vehicle_type'])
+        vehicle_type = ElectricVehicle.from_dict_interned(**kwargs['vehicle_type'])
 
         return ChargingEvent(arrival_time, parking_time, soc, vehicle_type)
+
+    @staticmethod
+    def build_batch(arrival_times, parking_times, socs, vehicle_type_ids):
+        """Calculates the attributes of many charging events at once. Each attribute is stored
+        as one array (column) instead of one object per charging event.
+
+        Args:
+            arrival_times: (array_like): Arrival times as :obj: `datetime.datetime` or
+                `numpy.datetime64`.
+            parking_times: (array_like): Parking times in hours.
+            socs: (array_like): SOCs of the vehicles at arrival.
+            vehicle_type_ids: (array_like): Position of the vehicle type of each charging event
+                in the list of vehicle types.
+
+        Returns:
+            batch: (dict): Attribute names as keys and :obj: `numpy.ndarray` as values. Contains
+                arrival_time, parking_time, leaving_time, soc, soc_target and vehicle_type_id.
+        """
+        # Microsecond resolution so the times match datetime.datetime exactly
+        arrival_times = np.asarray(arrival_times, dtype='datetime64[us]')
+        parking_times = np.asarray(parking_times, dtype=np.float64)
+        socs = np.asarray(socs, dtype=np.float64)
+        vehicle_type_ids = np.asarray(vehicle_type_ids, dtype=np.int32)
+
+        assert arrival_times.shape == parking_times.shape == socs.shape == \
+            vehicle_type_ids.shape, 'All columns of a batch must be of same length.'
+        # Checked once per batch so from_batch can skip the checks per charging event
+        assert ((socs >= 0) & (socs <= 1)).all(), 'All SOCs must be in between 0 and 1.'
+
+        parking_durations = np.rint(parking_times * 3.6e9).astype('timedelta64[us]')
+
+        return {'arrival_time': arrival_times,
+                'parking_time': parking_times,
+                'leaving_time': arrival_times + parking_durations,
+                'soc': socs,
+                'soc_target': np.ones(len(socs)),
+                'vehicle_type_id': vehicle_type_ids}
+
+    @staticmethod
+    def from_batch(batch, vehicle_types):
+        """Creates the instances of ChargingEvent of a batch created by build_batch.
+
+        Args:
+            batch: (dict): Attribute names as keys and :obj: `numpy.ndarray` as values.
+            vehicle_types: (list): Containing all instances of
+                :obj: `elvis.vehicle.ElectricVehicle` the vehicle_type_id refers to.
+
+        Returns:
+            charging_events: (list): Instances of ChargingEvent in order of the batch.
+        """
+        columns = zip(batch['arrival_time'].tolist(), batch['parking_time'].tolist(),
+                      batch['soc'].tolist(), batch['vehicle_type_id'].tolist(),
+                      batch['leaving_time'].tolist(), batch['soc_target'].tolist())
+
+        assert all(isinstance(vehicle_type, ElectricVehicle) for vehicle_type in vehicle_types)
+
+        return [ChargingEvent._make(arrival_time, parking_time, soc, vehicle_types[vehicle_type_id],
+                                    leaving_time, soc_target)
+                for arrival_time, parking_time, soc, vehicle_type_id, leaving_time, soc_target
+                in columns]
+
+    @staticmethod
+    def _make(arrival_time, parking_time, soc, vehicle_type, leaving_time, soc_target):
+        """Creates an instance of ChargingEvent from values that have already been validated
+            (e.g. column wise by build_batch) without checking them again."""
+        event = ChargingEvent.__new__(ChargingEvent)
+        event._idx = next(ChargingEvent.counter)
+        event.arrival_time = arrival_time
+        event.parking_time = parking_time
+        event.leaving_time = leaving_time
+        event.soc = soc
+        event.soc_target = soc_target
+        event.vehicle_type = vehicle_type
+        return event
@@ -10,13 +10,27 @@ TODO:
 """
 import math
 import datetime
+import functools
 import numpy as np
 
 import elvis.distribution as distribution
 import elvis.charging_event as charging_event
 
 from elvis.utility.walker import WalkerRandomSampling
-from sklearn.mixture import GaussianMixture
+
+# Random generator used for all sampling of charging events, see set_seed
+_rng = np.random.default_rng()
+
+
+def set_seed(seed):
+    """Re-seeds the random generator used to sample charging events, so that scenarios can be
+    realised reproducibly.
+
+    Args:
+        seed: (int): Seed of the new random generator. If None fresh entropy is used.
+    """
+    global _rng
+    _rng = np.random.default_rng(seed)
 
 
 def time_stamp_to_hours(time_stamps):
@@ -26,17 +40,13 @@ def time_stamp_to_hours(time_stamps):
         time_stamps (list): Containing the time stamps as :obj: `datetime.datetime`.
 
     Returns:
-        list: Hours passed.
+        :obj: `numpy.ndarray`: Hours passed.
     """
-    start = time_stamps[0]
-    hours_passed = []
-    for time_stamp in time_stamps:
-        delta = time_stamp - start
-        hour = delta.days * 24 + delta.seconds / 3600 + delta.microseconds / 3600 / 1000 / 1000
-        # add offset
-        hour += start.minute / 60 + start.second / 3600 + start.microsecond / 3600 / 1000 / 1000
-        hours_passed.append(hour)
-    return hours_passed
+    time_stamps = np.asarray(time_stamps, dtype='datetime64[us]')
+    # Beginning of the hour of the first time stamp, this already contains the offset of the
+    # minutes, seconds and microseconds of the first time stamp
+    start = time_stamps[0].astype('datetime64[h]').astype('datetime64[us]')
+    return (time_stamps - start).astype(np.int64) / 3.6e9
 
 
 def hours_to_time_stamps(hours, start):
@@ -48,17 +58,14 @@ def hours_to_time_stamps(hours, start):
           start (:obj: `datetime.datetime`): First time stamp.
 
     Returns:
-        list: Time stamps.
+        :obj: `numpy.ndarray`: Time stamps as `numpy.datetime64` in microsecond resolution.
     """
     # Define the corresponding time stamp to hour = 0.
     # Hour = 0 is the beginning of the hour of the first time stamp.
-    hour0_corr = datetime.datetime(start.year, start.month, start.day, start.hour)
-
-    time_stamps = []
-    for hour in hours:
-        time_stamps.append(hour0_corr + datetime.timedelta(hours=hour))
+    hour0_corr = np.datetime64(start.replace(minute=0, second=0, microsecond=0), 'us')
 
-    return time_stamps
+    # Round to the closest microsecond as datetime.timedelta does
+    return hour0_corr + np.rint(np.asarray(hours) * 3.6e9).astype('timedelta64[us]')
 
 
 def align_distribution(distr, first_time_stamp, last_time_stamp):
@@ -72,7 +79,8 @@ def align_distribution(distr, first_time_stamp, last_time_stamp):
         last_time_stamp (:obj: `datetime.datetime`): End of period.
 
     Returns:
-        aligned_distribution: (list): Containing the probabilities alligned to period.
+        aligned_distribution: (:obj: `numpy.ndarray`): Containing the probabilities alligned to
+            period.
         difference: Difference between first used 'time stamp' of the distribution and first
             time stamp of the simulation in hours.
     """
@@ -95,59 +103,116 @@ def align_distribution(distr, first_time_stamp, last_time_stamp):
     # Upward estimate of the needed length of the distribution
     total_weeks = math.ceil(period.total_seconds() / seconds_per_week)
 
-    aligned_distribution = distr[starting_pos:] + distr * total_weeks
+    aligned_distribution = np.tile(np.asarray(distr, dtype=np.float64),
+                                   total_weeks + 1)[starting_pos:]
     return aligned_distribution, difference
 
 
-def create_vehicle_arrivals(arrival_distribution, num_charging_events, time_steps):
-    """Creates vehicle arrival times.
+@functools.lru_cache(maxsize=8)
+def _arrival_cdf(arrival_distribution, first_time_step, resolution, num_steps):
+    """Calculates the hours of all time steps and the cumulative arrival probability at each of
+    them. Cached as all realisations of a scenario sample from the same distribution and
+    time steps.
 
     Args:
-        arrival_distribution (list): Containing hourly arrival probabilities for one week.
-        num_charging_events: (int): Number of charging events per week.
-        time_steps (list): List containing all time steps as :obj: `datetime.datetime` object.
+        arrival_distribution (tuple): Containing hourly arrival probabilities for one week.
+        first_time_step (:obj: `datetime.datetime`): First time step of the simulation.
+        resolution (:obj: `datetime.timedelta`): Time in between two adjacent time steps.
+        num_steps (int): Number of time steps.
 
     Returns:
-        list: Arrival times.
-
-    ToDo:
-        seeding seems to not work properly. With fixed seed small changes are still there,
-        changing the seed has a huge impact though.
+        corr_position: (:obj: `numpy.ndarray`): Hours of the time steps, read only.
+        cumulative_probability: (:obj: `numpy.ndarray`): Not normalized cumulative arrival
+            probability of the time steps, read only.
     """
+    time_steps = np.datetime64(first_time_step, 'us') + \
+        np.arange(num_steps) * np.timedelta64(resolution, 'us')
 
     coefficient = 168 / len(arrival_distribution)
 
     # Rearrange arrival distribution so it starts with first hour of simulation time
-    arrival_distribution, difference = align_distribution(arrival_distribution, time_steps[0],
-                                                          time_steps[-1])
+    arrival_distribution, difference = align_distribution(arrival_distribution, first_time_step,
+                                                          time_steps[-1].tolist())
 
     # generate x-values (hours away from first time step) of the distribution
-    hour_stamps = [x * coefficient - difference for x in range(len(arrival_distribution))]
+    hour_stamps = np.arange(len(arrival_distribution)) * coefficient - difference
     # Create distribution based on reordered arrival distribution
     dist = distribution.EquallySpacedInterpolatedDistribution.linear(
-        list(zip(hour_stamps, arrival_distribution)), None)
+        np.column_stack((hour_stamps, arrival_distribution)), None)
 
     # Calculate position of each time step at arrival distribution
     corr_position = time_stamp_to_hours(time_steps)
 
-    # Get arrival probablity for each time step of the simulation
-    arrival_probability = []
-    for pos in corr_position:
-        arrival_probability.append(dist[pos])
-    # Normalize probability
-    cumsum = sum(arrival_probability)
-    arrival_probability = [x / cumsum for x in arrival_probability]
+    # Get the cumulative arrival probablity for each time step of the simulation. It is not
+    # normalized, the random numbers are scaled to its total instead.
+    cumulative_probability = np.cumsum(dist(corr_position))
+    assert cumulative_probability[-1] > 0 and (np.diff(cumulative_probability) >= 0).all(), \
+        'Arrival probabilities must not be negative nor all zero during the simulation period.'
+
+    # The arrays are shared by all callers
+    corr_position.flags.writeable = False
+    cumulative_probability.flags.writeable = False
+    return corr_position, cumulative_probability
+
+
+def create_vehicle_arrivals(arrival_distribution, num_charging_events, time_steps, seed=None):
+    """Creates vehicle arrival times.
+
+    Args:
+        arrival_distribution (list): Containing hourly arrival probabilities for one week.
+        num_charging_events: (int): Number of charging events per week.
+        time_steps (list): List containing all time steps as :obj: `datetime.datetime` object.
+        seed: (int): Seed of the random generator used to sample the arrivals. If None the
+            generator of this module is used, see set_seed.
+
+    Returns:
+        :obj: `numpy.ndarray`: Sorted arrival times as `numpy.datetime64`.
+    """
+    if len(time_steps) > 1:
+        resolution = time_steps[1] - time_steps[0]
+    else:
+        resolution = datetime.timedelta(0)
+    corr_position, cumulative_probability = _arrival_cdf(
+        tuple(arrival_distribution), time_steps[0], resolution, len(time_steps))
+    total_probability = cumulative_probability[-1]
 
     # Get on average num_charging_events arrivals per week
     period = time_steps[-1] - time_steps[0]
     num_weeks = period.total_seconds() / 7 / 24 / 3600
-    corr_times = np.random.choice(corr_position, p=arrival_probability,
-                                  size=math.ceil(num_charging_events * num_weeks))
+    rng = _rng if seed is None else np.random.default_rng(seed)
+    # Sample the positions of the time steps by inverting the cumulative probability and look up
+    # their hours afterwards. This is what choice does, without normalizing and validating p.
+    # The last entry is left out so rounding of the scaled samples can not exceed the last step.
+    uniform_samples = rng.random(math.ceil(num_charging_events * num_weeks))
+    arrival_idx = np.searchsorted(cumulative_probability[:-1],
+                                  uniform_samples * total_probability, side='right')
+    corr_times = corr_position[arrival_idx]
 
     # Convert hours back to time_stamps
     arrivals = hours_to_time_stamps(corr_times, time_steps[0])
 
-    return sorted(arrivals)
+    return np.sort(arrivals)
+
+
+def sample_vehicle_type_ids(vehicle_types, count):
+    """Draws the vehicle type of charging events according to the probabilities of the
+    vehicle types.
+
+    Args:
+        vehicle_types: (list): Containing all instances of :obj: `elvis.vehicle.ElectricVehicle`
+        count: (int): Number of vehicle types to draw.
+
+    Returns:
+        :obj: `numpy.ndarray`: Positions of the drawn vehicle types in vehicle_types.
+    """
+    weights = np.array([vehicle_type.probability for vehicle_type in vehicle_types],
+                       dtype=np.float64)
+
+    # Walker's alias method only pays off its set up for many vehicle types
+    if len(vehicle_types) > 64:
+        return WalkerRandomSampling(weights).random(count=count, rng=_rng)
+
+    return _rng.choice(len(vehicle_types), size=count, p=weights / weights.sum())
 
 
 def create_charging_events_from_weekly_distribution(
@@ -181,25 +246,20 @@ def create_charging_events_from_weekly_distribution(
     assert len(vehicle_types) > 0, msg_no_vehicles
 
     arrivals = create_vehicle_arrivals(arrival_distribution, num_charging_events, time_steps)
-    weights = [vehicle_type.probability for vehicle_type in vehicle_types]
 
-    walker = WalkerRandomSampling(weights, keys=vehicle_types)
+    num_events = len(arrivals)
+    parking_times = np.clip(_rng.normal(mean_park, std_deviation_park, num_events), 0,
+                            max_parking_time)
+    socs = np.clip(_rng.normal(mean_soc, std_deviation_soc, num_events), 0, 1)
+    vehicle_type_ids = sample_vehicle_type_ids(vehicle_types, num_events)
 
-    charging_events = []
-    parking_time_samples = np.random.normal(mean_park, std_deviation_park, len(arrivals)).tolist()
-    soc_samples = np.random.normal(mean_soc, std_deviation_soc, len(arrivals)).tolist()
-    vehicle_type_samples = walker.random(count=len(arrivals)).tolist()
-    for arrival in arrivals:
-        parking_time = min(max(0, parking_time_samples.pop()), max_parking_time)
-        soc = min(max(0, soc_samples.pop()), 1)
-        vehicle_type = vehicle_type_samples.pop()
-        charging_events.append(charging_event.ChargingEvent(arrival, parking_time, soc,
-                                                            vehicle_type))
+    batch = charging_event.ChargingEvent.build_batch(arrivals, parking_times, socs,
+                                                     vehicle_type_ids)
 
-    return charging_events
+    return charging_event.ChargingEvent.from_batch(batch, vehicle_types)
 
 
-def init_gmm(means, weights, covariances):
+def init_gmm(means, weights, covariances, random_state=None):
     """
         Initialise the GMM.
 
@@ -208,6 +268,8 @@ def init_gmm(means, weights, covariances):
         weights: (list): Mixing weights for each mixture component.
         covariances: (list): Covariance for mixture component. In the used scikit-learn model
             a covariance_type of "full" is used.
+        random_state: (:obj: `numpy.random.RandomState`): Used by the GMM to sample. If None the
+            global numpy random state is used.
 
     Returns:
         gmm: (:obj:): Scikit-learn gaussian mixture model.
@@ -230,8 +292,10 @@ def init_gmm(means, weights, covariances):
     weights_np = np.asarray(weights)
     covariances_np = np.asarray(covariances)
 
-    # scikit-learn GMM
-    gmm = GaussianMixture()
+    # scikit-learn GMM, imported here as importing scikit-learn takes longer than everything else
+    # elvis needs when the GMM is not used
+    from sklearn.mixture import GaussianMixture
+    gmm = GaussianMixture(random_state=random_state)
 
     # initialise parameters
     gmm.means_ = means_np
@@ -251,39 +315,41 @@ def weeks_to_sample(time_steps):
     Returns:
         num_weeks: (int): # weeks to sample
     """
-    # Total duration of simulation period in hours
     last = time_steps[-1]
     first = time_steps[0]
-    total_hours = (last - first).total_seconds() / 3600
+    # Monday 0:00 of the week of the first time stamp, the GMM samples count from there
+    first_monday = (first - datetime.timedelta(days=first.weekday())).replace(
+        hour=0, minute=0, second=0, microsecond=0)
 
-    num_weeks = math.ceil(total_hours / 168)
+    # Every week from the first until (including) the week of the last time stamp
+    return (last - first_monday) // datetime.timedelta(weeks=1) + 1
 
-    # If the first time stamp is later in the week add one week to sample
-    if first.weekday() > last.weekday():
-        num_weeks += 1
-    elif first.weekday() == last.weekday():
-        if first.time() > last.time():
-            num_weeks += 1
 
-    return num_weeks
+def reset_offset_hours(samples, cut_off_hour):
+    """Moves the arrival times (first column) of GMM samples by cut_off_hour within their day.
+    Arrivals in the last cut_off_hour hours of a day are wrapped to the beginning of the same
+    day. Arrivals at or after 168 h are not changed.
 
+    Args:
+        samples: (:obj: `numpy.ndarray`): GMM samples, arrival time in hours in the first column.
+        cut_off_hour: (float): Hours the arrival times are moved.
 
-def reset_offset_hours(samples, cut_off_hour):
+    Returns:
+        samples: (:obj: `numpy.ndarray`): The same array with updated arrival times.
+    """
     assert isinstance(samples, np.ndarray)
-    for sample in samples:
-        time = sample[0]
-        for i in range(7):
-            if (i + 1) * 24 > time > ((i + 1) * 24 - cut_off_hour):
-                time -= 24 - cut_off_hour
-                sample[0] = time
-                break
-            elif (i + 1) * 24 > time < ((i + 1) * 24 - cut_off_hour):
-                time += cut_off_hour
-                sample[0] = time
-                break
+    time = samples[:, 0]
+    # End of the day of each arrival, arrivals before Monday 0:00 count to Monday
+    day_end = (np.maximum(np.floor(time / 24), 0) + 1) * 24
+    shifted = np.where(time > day_end - cut_off_hour, time - (24 - cut_off_hour),
+                       time + cut_off_hour)
+    # Arrivals exactly cut_off_hour before the end of the week are kept, as they always were
+    moved = (time < 168) & (time != 168 - cut_off_hour)
+    samples[:, 0] = np.where(moved, shifted, time)
 
     return samples
 
+
 def resample(gmm, min_parking_time, num_resamples, hour_offset=0):
     """If a sample is out of accepted range resample until a valid sample is found.
 
@@ -293,26 +359,13 @@ def resample(gmm, min_parking_time, num_resamples, hour_offset=0):
         num_resamples: (int): Number of resamples to create
         hour_offset: (float): Used in case an offset of hours within the gmm model is used.
     Returns:
-        sample: Sample of the gaussian mixture model
+        sample: (:obj: `numpy.ndarray`): Valid samples of the gaussian mixture model
         """
     assert isinstance(num_resamples, int)
-    parking_time = 0
     resamples, _ = gmm.sample(num_resamples)
     resamples = reset_offset_hours(resamples, hour_offset)
-    resamples = resamples.tolist()
-
-    to_delete = []
-    for i in range(len(resamples)):
-        sample = resamples[i]
-        if sample[1] < min_parking_time:
-            to_delete.append(i)
-
-    to_delete.sort(reverse=True)
 
-    for i in to_delete:
-        del resamples[i]
-
-    return resamples
+    return resamples[resamples[:, 1] >= min_parking_time]
 
 
 def create_charging_events_from_gmm(time_steps, num_charging_events, means, weights,
@@ -337,82 +390,66 @@ def create_charging_events_from_gmm(time_steps, num_charging_events, means, weig
         (list): containing num_charging_events instances of `ChargingEvent`.
     """
 
-    gmm = init_gmm(means, weights, covariances)
+    # scikit-learn does not take numpy Generators, derive a RandomState from the module's one
+    gmm = init_gmm(means, weights, covariances,
+                   np.random.RandomState(_rng.integers(2 ** 32, dtype=np.uint64)))
 
     num_weeks = weeks_to_sample(time_steps)
 
-    week_offset = 0
-    samples = []
     rounding_const = 1/((time_steps[1] - time_steps[0]).total_seconds() / 3600)
     min_parking_time = 0.167
     num_resamples = 100
+
+    # num_charging_events samples for each week at once
+    samples, _ = gmm.sample(num_charging_events * num_weeks)
+    samples = reset_offset_hours(samples, 5)
+
+    # replace samples with parking time < 10 min by valid resamples
+    too_short = samples[:, 1] < min_parking_time
+    num_too_short = np.count_nonzero(too_short)
     resamples = resample(gmm, min_parking_time, num_resamples, hour_offset=5)
-    resample_counter = 0
-
-    while num_weeks > week_offset / 168:
-        temp, _ = gmm.sample(num_charging_events)
-        temp = reset_offset_hours(temp, 5)
-        temp = temp.tolist()
-        for sample in temp:
-            if sample[1] < min_parking_time:  # parking time < 1 min
-                sample = resamples[resample_counter]
-                resample_counter += 1
-                if resample_counter == len(resamples):
-                    resamples = resample(gmm, min_parking_time, num_resamples, hour_offset=5)
-                    resample_counter = 0
-
-            sample[0] += week_offset
-            # to ensure arrivals fall on time stamps
-            sample[0] = math.ceil(sample[0] * rounding_const) / rounding_const
-            samples.append(sample)
-        week_offset += 168
-
-    samples.sort()
+    while len(resamples) < num_too_short:
+        resamples = np.concatenate(
+            (resamples, resample(gmm, min_parking_time, num_resamples, hour_offset=5)))
+    samples[too_short] = resamples[:num_too_short]
+
+    # Distribute the samples over the weeks. gmm.sample returns the samples ordered by mixture
+    # component so the week offsets are shuffled instead of assigned block wise.
+    week_offsets = np.repeat(np.arange(num_weeks) * 168, num_charging_events)
+    _rng.shuffle(week_offsets)
+    # to ensure arrivals fall on time stamps, in place on the arrival column
+    arrival_hours = samples[:, 0]
+    arrival_hours += week_offsets
+    arrival_hours *= rounding_const
+    np.ceil(arrival_hours, out=arrival_hours)
+    arrival_hours /= rounding_const
+
+    # Sort by arrival time, equal arrival times by parking time
+    samples = samples[np.lexsort((samples[:, 1], samples[:, 0]))]
     # hours from monday of the first week until the beginning of the simulation
     day_offset = time_steps[0].weekday() * 24
     first_step_hours = day_offset + time_steps[0].hour + time_steps[0].minute / 60 + \
                        time_steps[0].second / 60 / 60
-    # Remove samples before first simulation step
-    # Ensure stop is < first_step_hours for initialisation
-    stop = first_step_hours - 1
-    i = 0
-    while stop < first_step_hours:
-        stop = samples[i][0]
-        i += 1
-    # Discard all samples before first time stamp
-    samples = samples[i-1:]
-
     # simulation duration in hours
     sim_dur_hours = (time_steps[-1] - time_steps[0]).total_seconds() / 3600
-    i = 0
-    # ensure initial stop > sim_dur_hours
-    stop = sim_dur_hours + 1
-    while stop >= sim_dur_hours:
-        i += 1
-        stop = samples[-(i-1)][0]
-    # discard all charging events after simulation period
-    if i > 1:
-        samples = samples[:-(i-1)]
-
-    # transform arrival time in hours into datetime.datetime object
-    # initialise reference point Monday 0:00 of first simulation week
-    ref_date = time_steps[0] - datetime.timedelta(hours=first_step_hours)
-    for sample in samples:
-        sample_hour = sample[0]
-        sample[0] = ref_date + datetime.timedelta(hours=sample_hour)
-        # ensure 1 min < parking time < max_parking_time
-        sample[1] = min(sample[1], max_parking_time)
-
-    walker_weights = [vehicle_type.probability for vehicle_type in vehicle_types]
-    walker = WalkerRandomSampling(walker_weights, keys=vehicle_types)
-
-    charging_events = []
-    soc_samples = np.random.normal(mean_soc, std_deviation_soc, len(samples)).tolist()
-    vehicle_type_samples = walker.random(count=len(samples)).tolist()
-    for sample in samples:
-        soc = min(max(0, soc_samples.pop()), 1)
-        vehicle_type = vehicle_type_samples.pop()
-        charging_events.append(charging_event.ChargingEvent(sample[0], sample[1], soc,
-                                                            vehicle_type))
-
-    return charging_events
+
+    # Discard all samples before the first and after the last time stamp
+    first = np.searchsorted(samples[:, 0], first_step_hours)
+    last = np.searchsorted(samples[:, 0], first_step_hours + sim_dur_hours, side='right')
+    samples = samples[first:last]
+    num_events = len(samples)
+
+    # transform arrival time in hours into datetime64 relative to the
+    # reference point Monday 0:00 of first simulation week
+    ref_date = np.datetime64(time_steps[0] - datetime.timedelta(hours=first_step_hours), 'us')
+    arrivals = ref_date + np.rint(samples[:, 0] * 3.6e9).astype('timedelta64[us]')
+    # ensure 1 min < parking time < max_parking_time
+    parking_times = np.minimum(samples[:, 1], max_parking_time)
+
+    socs = np.clip(_rng.normal(mean_soc, std_deviation_soc, num_events), 0, 1)
+    vehicle_type_ids = sample_vehicle_type_ids(vehicle_types, num_events)
+
+    batch = charging_event.ChargingEvent.build_batch(arrivals, parking_times, socs,
+                                                     vehicle_type_ids)
+
+    return charging_event.ChargingEvent.from_batch(batch, vehicle_types)
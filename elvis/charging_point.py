@@ -5,16 +5,40 @@ It is limited by its power limits where as the lower limit has to be understood
 lower limit or zero.
 
 """
-from elvis.utility.elvis_general import floor
+import itertools
+import math
+
+import numpy as np
+
 from elvis.infrastructure_node import InfrastructureNode
 from elvis.charging_station import ChargingStation
 
 
+class _ConnectedVehicle:
+    """State of the vehicle connected to a charging point. Copied from its charging event at
+    connection so the SOC can change during the simulation without changing the event."""
+
+    __slots__ = ('id', 'arrival_time', 'parking_time', 'leaving_time', 'soc', 'soc_target',
+                 'vehicle_type')
+
+    def __init__(self, event):
+        self.id = event.id
+        self.arrival_time = event.arrival_time
+        self.parking_time = event.parking_time
+        self.leaving_time = event.leaving_time
+        self.soc = event.soc
+        self.soc_target = event.soc_target
+        self.vehicle_type = event.vehicle_type
+
+
 class ChargingPoint(InfrastructureNode):
     """Represents a point of connection between :obj: `charging_point.ChargingStation` and
     vehicles."""
 
-    counter = 1
+    __slots__ = ('connected_vehicle', '_battery')
+
+    # static id generator, advanced by 1 for every __init__
+    counter = itertools.count(1)
 
     def __init__(self, min_power, max_power, parent):
         """Create a charging point given all parameters.
@@ -27,13 +51,14 @@ class ChargingPoint(InfrastructureNode):
             """
         # A charging point must always be connected to a charging station
         assert isinstance(parent, ChargingStation)
-        identification = 'cp ' + str(ChargingPoint.counter)
-        ChargingPoint.counter += 1
+        identification = 'cp ' + str(next(ChargingPoint.counter))
 
         # set min and max power
         super().__init__(identification, min_power, max_power, parent=parent)
 
         self.connected_vehicle = None
+        # Battery of the connected vehicle, looked up every time step while it is connected
+        self._battery = None
 
     def __str__(self):
         printout = str(self.id)
@@ -43,32 +68,58 @@ class ChargingPoint(InfrastructureNode):
         """Make sure a vehicle is connected and return its leaving_time."""
         assert self.connected_vehicle is not None
 
-        return self.connected_vehicle['leaving_time']
+        return self.connected_vehicle.leaving_time
 
     def connect_vehicle(self, event):
-        """Assign dict of charging event as connected vehicle.
+        """Assign state of charging event as connected vehicle.
 
         Args:
             event: (:obj: `charging_event.ChargingEvent`): Event of car arrival."""
-        self.connected_vehicle = event.to_dict(deep=False)
+        self.connected_vehicle = _ConnectedVehicle(event)
+        self._battery = event.vehicle_type.battery
 
     def disconnect_vehicle(self):
         """Set field connected_vehicle to None so charging point is available for
             vehicle connection."""
         self.connected_vehicle = None
+        self._battery = None
 
     def charge_vehicle(self, power, resolution):
         """Charges the vehicle according to assigned power, capacity and efficiencies.
         TODO: add efficiencies"""
-        vehicle_type = self.connected_vehicle['vehicle_type']
-        battery = vehicle_type.battery
-        hours = resolution.total_seconds()/3600
+        self.charge_vehicle_with_hours(power, resolution.total_seconds()/3600)
+
+    def charge_vehicle_with_hours(self, power, hours):
+        """Same as charge_vehicle with the length of the charging period already converted to
+        hours, for callers that charge many vehicles with the same resolution."""
+        vehicle = self.connected_vehicle
         # TODO: This should be calculated by chaining some class methods from battery, vehicle type,
         # hardware. Each of them have different ways of converting/transporting power with their
         # specific losses
-        delta = power * hours / battery.capacity
+        delta = power * hours * self._battery.inv_capacity
+
+        vehicle.soc = min(1, vehicle.soc + delta)
+
+    @staticmethod
+    def charge_vehicles(cps, powers, resolution):
+        """Charges the vehicles of several charging points at once. Equal to calling
+        charge_vehicle for each of them.
+
+        Args:
+            cps: (list): Charging points with a connected vehicle.
+            powers: (list): Power assigned to each of the charging points.
+            resolution: (:obj: `datetime.timedelta`): Length of the charging period.
+        """
+        num_cps = len(cps)
+        hours = resolution.total_seconds()/3600
+        socs = np.fromiter((cp.connected_vehicle.soc for cp in cps), np.float64, num_cps)
+        inv_capacities = np.fromiter((cp._battery.inv_capacity for cp in cps), np.float64,
+                                     num_cps)
+
+        socs = np.minimum(1, socs + np.asarray(powers, dtype=np.float64) * hours * inv_capacities)
 
-        self.connected_vehicle['soc'] = min(1, self.connected_vehicle['soc'] + delta)
+        for cp, soc in zip(cps, socs.tolist()):
+            cp.connected_vehicle.soc = soc
 
     def max_hardware_power(self):
         """Calculate dependent on currently connected car the maximum power possible. Solely based
@@ -78,14 +129,11 @@ class ChargingPoint(InfrastructureNode):
             TODO: Go up the tree."""
 
         if self.connected_vehicle is not None:
-            vehicle = self.connected_vehicle
-            vehicle_type = vehicle['vehicle_type']
-            soc = vehicle['soc']
-            battery = vehicle_type.battery
-
-            max_power = min(self.max_power, battery.max_power_possible(soc))
-            max_power = floor(max_power)
-            return max_power
+            soc = self.connected_vehicle.soc
+
+            max_power = min(self.max_power, self._battery.max_power_possible(soc))
+            # floor to 3 decimals
+            return math.floor(max_power * 1000) / 1000
         return 0
 
     def min_hardware_power(self):
@@ -94,12 +142,9 @@ class ChargingPoint(InfrastructureNode):
             #TODO: Go up the tree."""
 
         if self.connected_vehicle is not None:
-            vehicle = self.connected_vehicle
-            vehicle_type = vehicle['vehicle_type']
-            soc = vehicle['soc']
-            battery = vehicle_type.battery
+            soc = self.connected_vehicle.soc
 
-            min_power = max(self.min_power, battery.min_power_possible(soc))
+            min_power = max(self.min_power, self._battery.min_power_possible(soc))
             return min_power
         return 0
 
@@ -120,22 +165,45 @@ class ChargingPoint(InfrastructureNode):
             print('ERROR: SOC exceeded boundaries. SOC: ', soc_target)
             pass
 
-        vehicle = self.connected_vehicle
-        current_soc = self.connected_vehicle['soc']
+        current_soc = self.connected_vehicle.soc
 
         # if the battery is already charged further than the given SOC no power is needed
         if current_soc > soc_target:
             return 0
 
-        vehicle_type = vehicle['vehicle_type']
-        battery = vehicle_type.battery
-        battery_capacity = battery.capacity
+        battery_capacity = self._battery.capacity
         timedelta_hours = timedelta.total_seconds() / 3600
 
         power_to_target = (soc_target - current_soc) * battery_capacity / timedelta_hours
 
         return power_to_target
 
+    @staticmethod
+    def powers_to_charge_target(cps, timedelta, soc_target):
+        """Calculate for several charging points at once the average power needed in a time
+            period to charge the batteries of the connected vehicles to a given soc target.
+            Equal to calling power_to_charge_target for each of them.
+
+        Args:
+            cps: (list): Charging points with a connected vehicle.
+            timedelta: (:obj: `datetime.timedelta`): Length of the timeperiod.
+            soc_target: (float): SOC target to be met.
+
+        Returns:
+            power_to_target: (:obj: `numpy.ndarray`): Power needed by each charging point to
+                reach the given SOC target. 0 if the SOC target is already exceeded."""
+        assert ChargingPoint.check_soc(soc_target), 'SOC exceeded boundaries. SOC: ' + \
+                                                    str(soc_target)
+
+        num_cps = len(cps)
+        socs = np.fromiter((cp.connected_vehicle.soc for cp in cps), np.float64, num_cps)
+        capacities = np.fromiter((cp._battery.capacity for cp in cps), np.float64, num_cps)
+        timedelta_hours = timedelta.total_seconds() / 3600
+
+        power_to_target = (soc_target - socs) * capacities / timedelta_hours
+        # if the battery is already charged further than the given SOC no power is needed
+        return np.where(socs > soc_target, 0, power_to_target)
+
     @staticmethod
     def check_soc(soc):
         """Make sure soc is in between [0, 1]"""
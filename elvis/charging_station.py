@@ -18,7 +18,9 @@ TODO:
     lower limit or zero.
 """
 
-from elvis.utility.elvis_general import floor
+import itertools
+import math
+
 from elvis.infrastructure_node import InfrastructureNode
 
 
@@ -26,12 +28,14 @@ class ChargingStation(InfrastructureNode):
     """Models a charging point of the charging ingrastructure.
     """
 
-    counter = 1
+    __slots__ = ('manual', 'automated', 'inductive', 'ac_power_supply', 'efficiency')
+
+    # static id generator, advanced by 1 for every __init__
+    counter = itertools.count(1)
 
     def __init__(self, min_power, max_power, parent):
         # id
-        identification = 'cs' + str(ChargingStation.counter)
-        ChargingStation.counter += 1
+        identification = 'cs' + str(next(ChargingStation.counter))
 
         # power limits
         super().__init__(identification, min_power, max_power, parent=parent)
@@ -56,15 +60,15 @@ class ChargingStation(InfrastructureNode):
             stations.
 
             Args:
-                power_assigned: (dict): Contains all :obj: `charging_point.ChargingPoint` and
-                    their currently already assigned power.
+                power_assigned: (dict or :obj: `numpy.ndarray`): Contains all
+                    :obj: `charging_point.ChargingPoint` and their currently already assigned
+                    power or the assigned power of all leafs ordered by leaf_id.
         """
 
-        power_cps = 0
-        for leaf in self.leafs:
-            power_cps += power_assigned[leaf]
+        power_cps = self.power_assigned_to_leafs(power_assigned)
 
         max_power = self.max_power - power_cps
-        max_power = floor(max_power)
+        # floor to 3 decimals
+        max_power = math.floor(max_power * 1000) / 1000
 
         return max_power
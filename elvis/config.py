@@ -2,17 +2,29 @@
 by Elvis."""
 
 import logging
+import sys
 import warnings
 import datetime
+import functools
+from typing import NamedTuple, Union
+import numpy as np
 import pandas as pd
 import yaml
 import gzip
 import json
+from concurrent.futures import ProcessPoolExecutor
+
+# libyaml bindings if PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 import elvis.sched.schedulers as schedulers
 from elvis.charging_event_generator import create_charging_events_from_weekly_distribution as \
     events_from_week_arr_dist
 from elvis.charging_event_generator import create_charging_events_from_gmm as events_from_gmm
+from elvis.charging_event_generator import set_seed
 from elvis.utility.elvis_general import create_time_steps, num_time_steps, transform_data, \
     adjust_resolution, repeat_data
 from elvis.battery import EVBattery
@@ -20,9 +32,129 @@ from elvis.vehicle import ElectricVehicle
 from elvis.charging_event import ChargingEvent
 from elvis.set_up_infrastructure import wallbox_infrastructure
 
+# Names of the scheduling policies accepted by with_scheduling_policy, normalized by
+# _policy_key
+_SCHEDULING_POLICIES = {
+    'uncontrolled': schedulers.Uncontrolled, 'uc': schedulers.Uncontrolled,
+    'discrimination_free': schedulers.DiscriminationFree, 'df': schedulers.DiscriminationFree,
+    'fcfs': schedulers.FCFS,
+    'with_storage': schedulers.WithStorage, 'ws': schedulers.WithStorage,
+    'optimized': schedulers.Optimized, 'opt': schedulers.Optimized,
+}
+
+
+def _policy_key(name):
+    """Normalize a scheduling policy name, e.g. 'Discrimination Free' -> 'discrimination_free'."""
+    return name.strip().lower().replace(' ', '_')
+
+
+def _numeric_array(values):
+    """Convert a flat sequence of int or float to a float64 array. The values are checked by the
+    dtype of a single conversion. Returns None if values is no such sequence."""
+    try:
+        values = np.asarray(values)
+    except ValueError:  # nested sequences of different lengths
+        return None
+    if values.ndim != 1 or values.dtype.kind not in 'biuf':
+        return None
+    return values.astype(np.float64, copy=False)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_datetime(date_str):
+    """Parse an isoformat datetime str. Cached since realisations of one scenario share their
+    start and end date."""
+    return datetime.datetime.fromisoformat(date_str)
+
+
+@functools.lru_cache(maxsize=8)
+def _time_steps(start_date, end_date, resolution):
+    """Cached create_time_steps for building several realisations of the same period. Returns a
+    tuple so the cached time steps can not be changed."""
+    return tuple(create_time_steps(start_date, end_date, resolution))
+
+
+def _seeded_realisation(config, seed, start_date, end_date, resolution):
+    """Create a realisation of config after re-seeding the event generator. Module level so
+    that it can be sent to the worker processes of create_realisations."""
+    set_seed(seed)
+    return config.create_realisation(start_date, end_date, resolution)
+
+
+class _VehicleSpec(NamedTuple):
+    """Key word arguments of ScenarioConfig.add_vehicle_types."""
+    brand: str
+    model: str
+    probability: float
+    battery: Union[EVBattery, dict]
+
+
+class _BatterySpec(NamedTuple):
+    """Battery parameters of a vehicle type, in the order of the arguments of EVBattery."""
+    capacity: float
+    max_charge_power: float
+    min_charge_power: float
+    efficiency: float
+    start_power_degradation: float = 1
+    max_degradation_level: float = 0
+
+
+# Columns ScenarioConfig.add_fleet requires, the names first
+_FLEET_COLUMNS = ('brand', 'model', 'probability', 'capacity', 'max_charge_power',
+                  'min_charge_power', 'efficiency')
+
+
+def _parse_timedelta(value):
+    """Parse a str in format %H:%M:%S or any pandas conform timedelta str, e.g. as written by
+    str(datetime.timedelta). Raises ValueError if the str can not be parsed."""
+    try:
+        date = datetime.datetime.strptime(value, '%H:%M:%S')
+        return datetime.timedelta(hours=date.hour, minutes=date.minute, seconds=date.second)
+    except ValueError:
+        return datetime.timedelta(seconds=pd.Timedelta(value).total_seconds())
+
+
+def _array_to_list(values):
+    """Convert numpy arrays and pandas Series to lists and pandas DataFrames to dicts of column
+    lists, return anything else unchanged."""
+    if isinstance(values, (np.ndarray, pd.Series)):
+        return values.tolist()
+    if isinstance(values, pd.DataFrame):
+        return values.to_dict('list')
+    return values
+
+
+# Conversion of the ScenarioConfig fields that are no plain types in to_dict
+_TO_PLAIN = {
+    'scheduling_policy': str,
+    'charging_events': lambda charging_events: [ce.to_dict() for ce in charging_events],
+    'vehicle_types': lambda vehicle_types: [vehicle.to_dict() for vehicle in vehicle_types],
+    'transformer_preload': _array_to_list,
+    'emissions_scenario': _array_to_list,
+    'arrival_distribution': _array_to_list,
+    'opening_hours': list,
+    'df_charging_period': str,
+    'transformer_preload_res_data': str,
+    'emissions_scenario_res_data': str,
+}
+
 
 class ScenarioConfig:
     """Describes a scenario defined by its stochastic distributions and hardware parameters."""
+
+    # Keyword arguments of __init__ that are assigned as they are
+    _KW_FIELDS = frozenset(('renewables_scenario', 'vehicle_types', 'sample_method',
+                            'charging_events', 'gmm_means', 'gmm_weights', 'gmm_covariances',
+                            'max_parking_time', 'transformer_preload_res_data',
+                            'transformer_preload_repeat', 'transformer_preload_col_pos',
+                            'emissions_scenario_res_data', 'emissions_scenario_repeat',
+                            'emissions_scenario_col_pos'))
+    # Keyword arguments of __init__ that are validated by their with_<key> method, in this order
+    _KW_SETTERS = ('emissions_scenario', 'transformer_preload', 'opening_hours',
+                   'arrival_distribution', 'infrastructure', 'scheduling_policy', 'mean_park',
+                   'std_deviation_park', 'mean_soc', 'std_deviation_soc', 'num_charging_events',
+                   'queue_length', 'disconnect_by_time')
+
     def __init__(self, **kwargs):
         # Time series data
         self.emissions_scenario = None
@@ -59,190 +191,139 @@ class ScenarioConfig:
         self.scheduling_policy = None
         self.df_charging_period = None
 
-        if 'emissions_scenario' in kwargs:
-            self.with_emissions_scenario(kwargs['emissions_scenario'])
-        if 'renewables_scenario' in kwargs:
-            self.renewables_scenario = kwargs['renewables_scenario']
-        if 'transformer_preload' in kwargs:
-            self.transformer_preload = kwargs['transformer_preload']
-
-        if 'vehicle_types' in kwargs:
-            self.vehicle_types = kwargs['vehicle_types']
-
-        if 'opening_hours' in kwargs:
-            self.with_opening_hours(kwargs['opening_hours'])
-
-        if 'sample_method' in kwargs:
-            self.sample_method = kwargs['sample_method']
-
-        if 'charging_events' in kwargs:
-            self.charging_events = kwargs['charging_events']
-        if 'arrival_distribution' in kwargs:
-            self.with_arrival_distribution(kwargs['arrival_distribution'])
-        if 'infrastructure' in kwargs:
-            self.with_infrastructure(kwargs['infrastructure'])
-        if 'scheduling_policy' in kwargs:
-            self.with_scheduling_policy(kwargs['scheduling_policy'])
+        for key in ScenarioConfig._KW_FIELDS.intersection(kwargs):
+            setattr(self, key, kwargs[key])
+        # Data resolutions passed as str, e.g. by from_dict
+        for key in ('transformer_preload_res_data', 'emissions_scenario_res_data'):
+            if isinstance(kwargs.get(key), str):
+                setattr(self, key, _parse_timedelta(kwargs[key]))
+        for key in ScenarioConfig._KW_SETTERS:
+            if key in kwargs:
+                getattr(self, 'with_' + key)(kwargs[key])
         if isinstance(self.scheduling_policy, schedulers.DiscriminationFree):
             if 'df_charging_period' in kwargs:
                 self.with_df_charging_period(kwargs['df_charging_period'])
             else:
                 self.with_df_charging_period(datetime.timedelta(minutes=15))
-        if 'mean_park' in kwargs:
-            self.with_mean_park(kwargs['mean_park'])
-        if 'std_deviation_park' in kwargs:
-            self.with_std_deviation_park(kwargs['std_deviation_park'])
-        if 'mean_soc' in kwargs:
-            self.with_mean_soc(kwargs['mean_soc'])
-        if 'std_deviation_soc' in kwargs:
-            self.with_std_deviation_soc(kwargs['std_deviation_soc'])
-
-        # Gaussian Mixture Model params
-        if 'gmm_means' in kwargs:
-            self.gmm_means = kwargs['gmm_means']
-        if 'gmm_weights' in kwargs:
-            self.gmm_weights = kwargs['gmm_weights']
-        if 'gmm_covariances' in kwargs:
-            self.gmm_covariances = kwargs['gmm_covariances']
-
-        if 'max_parking_time' in kwargs:
-            self.max_parking_time = kwargs['max_parking_time']
-        if 'num_charging_events' in kwargs:
-            self.with_num_charging_events(kwargs['num_charging_events'])
-        if 'queue_length' in kwargs:
-            self.with_queue_length(kwargs['queue_length'])
-        if 'disconnect_by_time' in kwargs:
-            self.with_disconnect_by_time(kwargs['disconnect_by_time'])
-        if 'transformer_preload_res_data' in kwargs:
-            self.transformer_preload_res_data = kwargs['transformer_preload_res_data']
-        if 'transformer_preload_repeat' in kwargs:
-            self.transformer_preload_repeat = kwargs['transformer_preload_repeat']
-        if 'transformer_preload_col_pos' in kwargs:
-            self.transformer_preload_col_pos = kwargs['transformer_preload_col_pos']
-        if 'emissions_scenario_res_data' in kwargs:
-            self.emissions_scenario_res_data = kwargs['emissions_scenario_res_data']
-        if 'emissions_scenario_repeat' in kwargs:
-            self.emissions_scenario_repeat = kwargs['emissions_scenario_repeat']
-        if 'emissions_scenario_col_pos' in kwargs:
-            self.emissions_scenario_col_pos = kwargs['emissions_scenario_col_pos']
+
+    def __getstate__(self):
+        """Pickle the scheduling policy by its name, e.g. when sending the config to the worker
+        processes of create_realisations."""
+        state = self.__dict__.copy()
+        if self.scheduling_policy is not None:
+            state['scheduling_policy'] = str(self.scheduling_policy)
+        return state
+
+    def __setstate__(self, state):
+        """Restore a pickled config with a new instance of its scheduling policy."""
+        self.__dict__.update(state)
+        if isinstance(self.scheduling_policy, str):
+            self.scheduling_policy = _SCHEDULING_POLICIES[_policy_key(self.scheduling_policy)]()
 
     def __str__(self):
-        printout = ''
-        if self.vehicle_types is None:
-            printout += str('Vehicle types: None\n')
+        if not self.vehicle_types:
+            lines = ['Vehicle types: None']
         else:
-            printout = 'Vehicle types: ' + str(vt + '\n' for vt in self.vehicle_types)
-
-        printout += str('Mean parking time: ' + str(self.mean_park) + '\n')
-        printout += str('Std deviation of parking time: ' + str(self.std_deviation_park) + '\n')
-        printout += str('Mean value of the SOC distribution: ' + str(self.mean_soc) + '\n')
-        printout += str('Std deviation of the SOC distribution: ' +
-                        str(self.std_deviation_soc) + '\n')
-        printout += str('Max parking time: ' +
-                        str(self.max_parking_time) + '\n')
-        printout += str('Number of charging events per week: ' +
-                        str(self.num_charging_events) + '\n')
+            lines = ['Vehicle types: ' + '; '.join(str(vt) for vt in self.vehicle_types)]
+
+        lines.append(f'Mean parking time: {self.mean_park}')
+        lines.append(f'Std deviation of parking time: {self.std_deviation_park}')
+        lines.append(f'Mean value of the SOC distribution: {self.mean_soc}')
+        lines.append(f'Std deviation of the SOC distribution: {self.std_deviation_soc}')
+        lines.append(f'Max parking time: {self.max_parking_time}')
+        lines.append(f'Number of charging events per week: {self.num_charging_events}')
 
         if self.disconnect_by_time is True:
-            printout += str('Vehicles are disconnected only depending on their parking time\n')
+            lines.append('Vehicles are disconnected only depending on their parking time')
         else:
-            printout += str('Vehicles are disconnected depending on their SOC and their parking'
-                            'parking time (what ever comes first\n')
+            lines.append('Vehicles are disconnected depending on their SOC and their parking '
+                         'time (what ever comes first)')
         if self.queue_length is None:
-            printout += str('No queue is considered.\n')
+            lines.append('No queue is considered.')
         else:
-            printout += str('Queue length: ' + str(self.queue_length) + '\n')
+            lines.append(f'Queue length: {self.queue_length}')
 
-        printout += str('Opening hours: ' + str(self.opening_hours) + '\n')
-        printout += str('Scheduling policy: ' + str(self.scheduling_policy) + '\n')
+        lines.append(f'Opening hours: {self.opening_hours}')
+        lines.append(f'Scheduling policy: {self.scheduling_policy}')
 
-        return printout
+        return '\n'.join(lines) + '\n'
 
     def to_dict(self):
-        dictionary = self.__dict__.copy()
-        if self.scheduling_policy is not None:
-            dictionary['scheduling_policy'] = str(self.scheduling_policy)
-        if self.charging_events is not None:
-            dictionary['charging_events'] = [ce.to_dict() for ce in self.charging_events]
-
-        # TODO what if transformer preload is not a list
-        dictionary['transformer_preload'] = self.transformer_preload
+        # Only plain types so the dict can be written to json and safe yaml
+        return {key: value if value is None or key not in _TO_PLAIN else _TO_PLAIN[key](value)
+                for key, value in self.__dict__.items()}
 
-        if len(self.vehicle_types) > 0:
-            dictionary['vehicle_types'] = [vehicle.to_dict() for vehicle in self.vehicle_types]
-
-        return dictionary
+    # Keys from_dict can not do without
+    _REQUIRED_KEYS = ('infrastructure', 'scheduling_policy', 'num_charging_events',
+                      'queue_length', 'disconnect_by_time', 'vehicle_types')
+    # Keys in files of the config builder that are not used by ScenarioConfig
+    _IGNORED_KEYS = frozenset(('repeat_preload', 'resolution_preload', 'start_date', 'end_date',
+                               'resolution'))
 
     @staticmethod
     def from_dict(dictionary):
 
         assert type(dictionary) is dict, 'Input of wrong type: ' + str(type(dictionary))
+        missing = [key for key in ScenarioConfig._REQUIRED_KEYS if key not in dictionary]
+        assert not missing, ', '.join(missing) + ' missing to create a ScenarioConfig.'
+        unknown = dictionary.keys() - ScenarioConfig._KW_FIELDS - \
+            ScenarioConfig._IGNORED_KEYS - set(ScenarioConfig._KW_SETTERS) - \
+            {'vehicle_types', 'df_charging_period'}
+        assert not unknown, ', '.join(sorted(unknown)) + ' unknown to ScenarioConfig.'
+
+        # Unset values keep their default, all others are assigned and validated as in __init__
+        kwargs = {key: value for key, value in dictionary.items()
+                  if value is not None and key != 'vehicle_types'}
+        config = ScenarioConfig(**kwargs)
+        config.with_vehicle_types(vehicle_types=dictionary['vehicle_types'])
 
-        config = ScenarioConfig()
-        config.with_infrastructure(dictionary['infrastructure'])
-        config.with_scheduling_policy(dictionary['scheduling_policy'])
-        if 'mean_park' in dictionary:
-            config.with_mean_park(dictionary['mean_park'])
-        if 'std_deviation_park' in dictionary:
-            config.with_std_deviation_park(dictionary['std_deviation_park'])
-        if 'mean_soc' in dictionary:
-            config.with_mean_soc(dictionary['mean_soc'])
-        if 'std_deviation_soc' in dictionary:
-            config.with_std_deviation_soc(dictionary['std_deviation_soc'])
-        config.with_num_charging_events(dictionary['num_charging_events'])
-        config.with_queue_length(dictionary['queue_length'])
-        config.with_disconnect_by_time(dictionary['disconnect_by_time'])
-
-        if 'df_charging_period' in dictionary:
-            config.with_df_charging_period(dictionary['df_charging_period'])
-        else:
-            config.with_df_charging_period(datetime.timedelta(minutes=15))
+        if config.df_charging_period is None:
+            config.with_df_charging_period(dictionary.get('df_charging_period') or
+                                           datetime.timedelta(minutes=15))
+
+        return config
 
-        if 'sample_method' in dictionary:
-            config.sample_method = dictionary['sample_method']
-        if 'max_parking_time' in dictionary:
-            config.max_parking_time = dictionary['max_parking_time']
+    def to_yaml(self, yaml_file):
+        data = self.to_dict()
+        with open(yaml_file, 'w') as file:
+            yaml.dump(data, file, Dumper=SafeDumper, default_flow_style=None, sort_keys=False)
+        return
 
-        if 'opening_hours' in dictionary:
-            config.with_opening_hours(dictionary['opening_hours'])
+    @staticmethod
+    def from_yaml_file(yaml_file):
+        """Create an instance of ScenarioConfig from a yaml file.
 
-        if 'transformer_preload' in dictionary:
-            config.transformer_preload = dictionary['transformer_preload']
+        Args:
+            yaml_file: (str): Path of the yaml file.
+        """
+        with open(yaml_file, 'r') as file:
+            data = yaml.load(file, Loader=SafeLoader)
 
-        config.with_vehicle_types(vehicle_types=dictionary['vehicle_types'])
-        if 'arrival_distribution' in dictionary:
-            config.with_arrival_distribution(dictionary['arrival_distribution'])
-        if 'charging_events' in dictionary:
-            config.charging_events = dictionary['charging_events']
-
-        if 'gmm_means' in dictionary:
-            config.gmm_means = dictionary['gmm_means']
-        if 'gmm_weights' in dictionary:
-            config.gmm_weights = dictionary['gmm_weights']
-        if 'gmm_covariances' in dictionary:
-            config.gmm_covariances = dictionary['gmm_covariances']
-
-        if 'transformer_preload_res_data' in dictionary:
-            config.transformer_preload_res_data = dictionary['transformer_preload_res_data']
-        if 'transformer_preload_repeat' in dictionary:
-            config.transformer_preload_repeat = dictionary['transformer_preload_repeat']
-        if 'transformer_preload_col_pos' in dictionary:
-            config.transformer_preload_col_pos = dictionary['transformer_preload_col_pos']
-        if 'emissions_scenario_res_data' in dictionary:
-            config.emissions_scenario_res_data = dictionary['emissions_scenario_res_data']
-        if 'emissions_scenario_repeat' in dictionary:
-            config.emissions_scenario_repeat = dictionary['emissions_scenario_repeat']
-        if 'emissions_scenario_col_pos' in dictionary:
-            config.emissions_scenario_col_pos = dictionary['emissions_scenario_col_pos']
+        return ScenarioConfig.from_yaml(data)
 
-        return config
+    def to_json(self, json_file):
+        """Write the config to a json file. Much faster to write and read than yaml.
 
-    def to_yaml(self, yaml_file):
+        Args:
+            json_file: (str): Path of the json file.
+        """
         data = self.to_dict()
-        with open(yaml_file, 'w') as file:
-            yaml.dump(data, file, default_flow_style=None)
+        with open(json_file, 'w') as file:
+            json.dump(data, file)
         return
 
+    @staticmethod
+    def from_json(json_file):
+        """Create an instance of ScenarioConfig from a json file written by to_json.
+
+        Args:
+            json_file: (str): Path of the json file.
+        """
+        with open(json_file, 'r') as file:
+            data = json.load(file)
+
+        return ScenarioConfig.from_dict(data)
+
     @staticmethod
     def from_yaml(yaml_str):
         """Create an instance of ScenarioConfig from a yaml str.
@@ -271,19 +352,48 @@ class ScenarioConfig:
         realisation = ScenarioRealisation(config=self, **time_params)
         return realisation
 
+    def create_realisations(self, num_realisations, start_date, end_date, resolution, seed=None,
+                            max_workers=None):
+        """Creates several independent realisations of self in parallel processes, e.g. for
+        Monte-Carlo studies.
+
+        Args:
+            num_realisations: (int): Number of realisations to create.
+            start_date: (:obj: `datetime.datetime`): First time stamp.
+            end_date: (:obj: `datetime.datetime`): Upper bound for time stamps.
+            resolution: (:obj: `datetime.timedelta`): Time in between two adjacent time stamps.
+            seed: (int): Base seed the seeds of the single realisations are spawned from. If
+                None fresh entropy is used.
+            max_workers: (int): Maximum number of processes. If None the number of processors
+                is used.
+
+        Returns:
+            realisations: (list): Scenario realisations of type
+                :obj: `elvis.scenario.ScenarioRealisation`.
+        """
+        assert isinstance(num_realisations, int) and num_realisations > 0, \
+            'num_realisations must be a positive int.'
+
+        # Every realisation gets its own independent seed so that the workers do not sample
+        # correlated charging events.
+        seeds = np.random.SeedSequence(seed).spawn(num_realisations)
+        num_seeds = len(seeds)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            realisations = executor.map(_seeded_realisation, [self] * num_seeds, seeds,
+                                        [start_date] * num_seeds, [end_date] * num_seeds,
+                                        [resolution] * num_seeds)
+            return list(realisations)
+
     def with_arrival_distribution(self, arrival_distribution):
         # TODO: Add pandas
-        assert type(arrival_distribution) is list, 'Arrival distribution must be of type list or ' \
-                                                   'pandas DataFrame.'
+        assert isinstance(arrival_distribution, (list, np.ndarray)), \
+            'Arrival distribution must be of type list or numpy ndarray.'
 
         msg_invalid_value_type = "Arrival distribution should be of type: pandas DataFrame or a " \
                                  "list containing float or int."
         # Check if all values in list are either float or int
-        if arrival_distribution is list:
-            assert all(isinstance(x, (float, int)) for x in arrival_distribution), \
-                msg_invalid_value_type
-        else:
-            NotImplementedError()
+        arrival_distribution = _numeric_array(arrival_distribution)
+        assert arrival_distribution is not None, msg_invalid_value_type
 
         self.arrival_distribution = arrival_distribution
 
@@ -304,7 +414,8 @@ class ScenarioConfig:
         """Assigns values regarding the emissions scenario to config.
 
         Args:
-            emissions_scenario: Either of type int/float, list, or pandas DataFrame/Series.
+            emissions_scenario: Either of type int/float, list, or pandas DataFrame/Series. A dict
+                of column lists, as written by to_dict for a DataFrame, is read as DataFrame.
             col_pos: (int): If emissions scenario is of type pandas DataFrame: col_pos refers to
                 the column the emissions scenario is stored.
             res_data: (datetime.timedelta): If emissions scenario is of type list and does not align
@@ -314,6 +425,8 @@ class ScenarioConfig:
                 simulation period: repeat=True indicates that the list shall be repeated until
                 the whole simulation period is covered.
         """
+        if isinstance(emissions_scenario, dict):
+            emissions_scenario = pd.DataFrame(emissions_scenario)
         if isinstance(emissions_scenario, (pd.Series, pd.DataFrame)):
             self.emissions_scenario = emissions_scenario
         else:
@@ -324,8 +437,7 @@ class ScenarioConfig:
                                      " a list containing float or int."
             # Check if all values in list are either float or int
             if type(emissions_scenario) is list:
-                assert all(isinstance(x, (float, int)) for x in emissions_scenario), \
-                    msg_invalid_value_type
+                assert _numeric_array(emissions_scenario) is not None, msg_invalid_value_type
 
             self.emissions_scenario = emissions_scenario
 
@@ -333,24 +445,17 @@ class ScenarioConfig:
             assert isinstance(res_data, (str, datetime.timedelta))
             if type(res_data) is str:
                 try:
-                    date = datetime.datetime.strptime(res_data, '%H:%M:%S')
-                    self.emissions_scenario_res_data = datetime.timedelta(hours=date.hour,
-                                                                          minutes=date.minute,
-                                                                          seconds=date.second)
+                    self.emissions_scenario_res_data = _parse_timedelta(res_data)
                 except ValueError:
-                    try:
-                        seconds = pd.Timedelta(res_data).total_seconds()
-                        self.emissions_scenario_res_data = datetime.timedelta(seconds=seconds)
-                    except ValueError:
-                        print('Incorrect timedelta format for resolution pls use: %H:%M:%S or '
-                              'a pandas conform timedelta format.')
+                    print('Incorrect timedelta format for resolution pls use: %H:%M:%S or '
+                          'a pandas conform timedelta format.')
             # datetime.timedelta
             else:
                 self.emissions_scenario_res_data = res_data
 
         if repeat is not False:
             assert type(repeat) is bool, 'Repeat can only be True or False.'
-            self.emissions_scenario = True
+            self.emissions_scenario_repeat = True
 
         if col_pos != 0:
             assert isinstance(col_pos, int), 'Column position (col_pos) must be a positive integer'
@@ -368,7 +473,8 @@ class ScenarioConfig:
         """Assigns values regarding the transformer preload to config.
 
         Args:
-            transformer_preload: Either of type int/float, list, or pandas DataFrame/Series.
+            transformer_preload: Either of type int/float, list, or pandas DataFrame/Series. A dict
+                of column lists, as written by to_dict for a DataFrame, is read as DataFrame.
             col_pos: (int): If transformer_preload is of type pandas DataFrame: col_pos refers to
                 the column the transformer preload is stored.
             res_data: (datetime.timedelta): If transfomer preload is of type list and does not align
@@ -378,18 +484,20 @@ class ScenarioConfig:
                 simulation period: repeat=True indicates that the list shall be repeated until
                 the whole simulation period is covered.
         """
+        if isinstance(transformer_preload, dict):
+            transformer_preload = pd.DataFrame(transformer_preload)
         if isinstance(transformer_preload, (pd.Series, pd.DataFrame)):
             self.transformer_preload = transformer_preload
         else:
-            assert isinstance(transformer_preload, (int, float, list)), \
+            assert isinstance(transformer_preload, (int, float, list, np.ndarray)), \
                 'Transformer preload must be of type list or pandas DataFrame.'
 
             msg_invalid_value_type = "Transformer preload should be of type: pandas DataFrame or" \
                                      " a list containing float or int."
             # Check if all values in list are either float or int
             if type(transformer_preload) is list:
-                assert all(isinstance(x, (float, int)) for x in transformer_preload), \
-                    msg_invalid_value_type
+                transformer_preload = _numeric_array(transformer_preload)
+                assert transformer_preload is not None, msg_invalid_value_type
 
             self.transformer_preload = transformer_preload
 
@@ -397,17 +505,10 @@ class ScenarioConfig:
             assert isinstance(res_data, (str, datetime.timedelta))
             if type(res_data) is str:
                 try:
-                    date = datetime.datetime.strptime(res_data, '%H:%M:%S')
-                    self.transformer_preload_res_data = datetime.timedelta(hours=date.hour,
-                                                                           minutes=date.minute,
-                                                                           seconds=date.second)
+                    self.transformer_preload_res_data = _parse_timedelta(res_data)
                 except ValueError:
-                    try:
-                        seconds = pd.Timedelta(res_data).total_seconds()
-                        self.transformer_preload_res_data = datetime.timedelta(seconds=seconds)
-                    except ValueError:
-                        print('Incorrect timedelta format for resolution pls use: %H:%M:%S or '
-                              'a pandas conform timedelta format.')
+                    print('Incorrect timedelta format for resolution pls use: %H:%M:%S or '
+                          'a pandas conform timedelta format.')
             # datetime.timedelta
             else:
                 self.transformer_preload_res_data = res_data
@@ -425,7 +526,8 @@ class ScenarioConfig:
     def with_scheduling_policy(self, scheduling_policy_input):
         """Update the scheduling policy to use.
         Default: :obj: `elvis.sched.schedulers.Uncontrolled`.
-        Use default if input not a str or str can not be matched.
+        Use default if input not a str or str can not be matched. Names are matched ignoring
+        case, surrounding whitespace and spaces vs. underscores.
 
         Args:
             scheduling_policy_input: Either str containing name of the scheduling policy to be used.
@@ -447,20 +549,9 @@ class ScenarioConfig:
             return self
 
         # Match string
-        if scheduling_policy_input in ('Uncontrolled', 'UC', 'Uc', 'uc'):
-            self.scheduling_policy = schedulers.Uncontrolled()
-
-        elif scheduling_policy_input in ('Discrimination Free', 'DF', 'df'):
-            self.scheduling_policy = schedulers.DiscriminationFree()
-
-        elif scheduling_policy_input == 'FCFS':
-            self.scheduling_policy = schedulers.FCFS()
-
-        elif scheduling_policy_input in ('With Storage', 'ws', 'WS'):
-            self.scheduling_policy = schedulers.WithStorage()
-
-        elif scheduling_policy_input in ('Optimized', 'opt', 'OPT'):
-            self.scheduling_policy = schedulers.Optimized()
+        policy = _SCHEDULING_POLICIES.get(_policy_key(scheduling_policy_input))
+        if policy is not None:
+            self.scheduling_policy = policy()
 
         # invalid str use default: Uncontrolled
         else:
@@ -602,7 +693,8 @@ class ScenarioConfig:
                     - If vehicle_type is of type list and at least one of the entries is not of
                         type :obj: `ElectricVehicle`.
                     - If vehicle type is not a list and not of type :obj: `ElectricVehicle`.
-                    - If kwargs are passed and the keys do not contain the variable names listed
+                TypeError:
+                    - If kwargs are passed and the keys do not match the variable names listed
                         above.
         """
         # if list with multiple vehicle_type instances is passed add multiple
@@ -610,57 +702,89 @@ class ScenarioConfig:
             for vehicle in vehicle_type:
                 assert isinstance(vehicle, ElectricVehicle)
                 self.vehicle_types.append(vehicle)
-                return
+            return
         # if an instance of vehicle type is passed assign
         elif vehicle_type is not None:
             assert isinstance(vehicle_type, ElectricVehicle)
             self.vehicle_types.append(vehicle_type)
             return
 
-        assert 'brand' in kwargs
-        assert 'model' in kwargs
-        assert 'probability' in kwargs
-        assert 'battery' in kwargs
+        # Raises TypeError if a field is missing or unknown
+        spec = _VehicleSpec(**kwargs)
 
-        brand = str(kwargs['brand'])
-        model = str(kwargs['model'])
-        probability = kwargs['probability']
+        # Interned since every realisation of a fleet repeats the same few names
+        brand = sys.intern(str(spec.brand))
+        model = sys.intern(str(spec.model))
 
-        # if all fields of ElectricVehicle are passed and an instance of EVBattery is already made
-        if isinstance(kwargs['battery'], EVBattery):
-            battery = kwargs['battery']
-            self.vehicle_types.append(ElectricVehicle(brand, model, battery, probability))
-            return
-
-        # if there is no instance of EVBattery check if all parameters are passed.
-        assert 'capacity' in kwargs['battery']
-        assert 'max_charge_power' in kwargs['battery']
-        assert 'min_charge_power' in kwargs['battery']
-        assert 'efficiency' in kwargs['battery']
-
-        capacity = kwargs['battery']['capacity']
-        max_charge_power = kwargs['battery']['max_charge_power']
-        min_charge_power = kwargs['battery']['min_charge_power']
-        efficiency = kwargs['battery']['efficiency']
-
-        # Power degradations when battery reaches certain SOC level shall be considered
-        if 'start_power_degradation' and 'max_degradation_level' in kwargs['battery']:
-            start_power_degradation = kwargs['battery']['start_power_degradation']
-            max_degradation_level = kwargs['battery']['max_degradation_level']
-
-            battery = EVBattery(capacity=capacity,
-                                max_charge_power=max_charge_power,
-                                min_charge_power=min_charge_power,
-                                efficiency=efficiency,
-                                start_power_degradation=start_power_degradation,
-                                max_degradation_level=max_degradation_level)
-        # No SOC-dependent power degradations considered
-        else:
-            battery = EVBattery(capacity=capacity, max_charge_power=max_charge_power,
-                                min_charge_power=min_charge_power, efficiency=efficiency, )
+        # if there is no instance of EVBattery yet build it from the battery parameters.
+        battery = spec.battery
+        if not isinstance(battery, EVBattery):
+            # Power degradations when battery reaches certain SOC level are only considered if
+            # the max degradation level is given
+            if 'max_degradation_level' in battery:
+                fields = _BatterySpec._fields
+            else:
+                fields = _BatterySpec._fields[:4]
+            battery = EVBattery(*_BatterySpec(**{key: battery[key] for key in fields
+                                                 if key in battery}))
 
         # get instance of ElectricVehicle with initialized battery
-        self.vehicle_types.append(ElectricVehicle(brand, model, battery, probability))
+        self.vehicle_types.append(ElectricVehicle(brand, model, battery, spec.probability))
+        return self
+
+    def add_fleet(self, fleet):
+        """Add several vehicle types at once from a column-wise fleet description, with one
+        entry per vehicle type in each column.
+
+        Args:
+            fleet: (dict or :obj: `pandas.DataFrame`): Columns brand, model, probability,
+                capacity, max_charge_power, min_charge_power and efficiency. Optionally
+                start_power_degradation and max_degradation_level.
+
+        Raises:
+            AssertionError: If a column is missing, the columns differ in length or a
+                battery parameter is out of bounds.
+        """
+        missing = [key for key in _FLEET_COLUMNS if key not in fleet]
+        assert not missing, ', '.join(missing) + ' missing in the fleet.'
+
+        num_vehicles = len(fleet['brand'])
+        columns = {}
+        for key in _FLEET_COLUMNS[2:]:
+            columns[key] = np.asarray(fleet[key], dtype=np.float64)
+        columns['start_power_degradation'] = np.asarray(
+            fleet['start_power_degradation'] if 'start_power_degradation' in fleet
+            else np.ones(num_vehicles), dtype=np.float64)
+        columns['max_degradation_level'] = np.asarray(
+            fleet['max_degradation_level'] if 'max_degradation_level' in fleet
+            else np.zeros(num_vehicles), dtype=np.float64)
+        assert len(fleet['model']) == num_vehicles and \
+            all(values.shape == (num_vehicles,) for values in columns.values()), \
+            'All columns of the fleet must be flat and of the same length.'
+
+        # Check the bounds of all vehicles at once, EVBattery only repeats them per vehicle
+        assert (columns['capacity'] > 0).all() and \
+            ((columns['efficiency'] >= 0) & (columns['efficiency'] <= 1)).all() and \
+            ((columns['start_power_degradation'] >= 0) &
+             (columns['start_power_degradation'] <= 1)).all() and \
+            ((columns['max_degradation_level'] >= 0) &
+             (columns['max_degradation_level'] <= 1)).all() and \
+            (columns['max_degradation_level'] * columns['max_charge_power'] >=
+             columns['min_charge_power']).all(), \
+            'Invalid battery parameters in the fleet.'
+
+        # EVBattery and ElectricVehicle expect python floats
+        columns = {key: values.tolist() for key, values in columns.items()}
+        for brand, model, probability, capacity, max_power, min_power, efficiency, start, \
+                level in zip(fleet['brand'], fleet['model'], columns['probability'],
+                             columns['capacity'], columns['max_charge_power'],
+                             columns['min_charge_power'], columns['efficiency'],
+                             columns['start_power_degradation'],
+                             columns['max_degradation_level']):
+            battery = EVBattery(capacity, max_power, min_power, efficiency, start, level)
+            self.vehicle_types.append(ElectricVehicle(sys.intern(str(brand)),
+                                                      sys.intern(str(model)),
+                                                      battery, probability))
         return self
 
     def with_opening_hours(self, opening_hours):
@@ -670,14 +794,17 @@ class ScenarioConfig:
             self.opening_hours = opening_hours
             return self
 
+        # json and yaml files store the opening hours as a list
+        if isinstance(opening_hours, list):
+            opening_hours = tuple(opening_hours)
         assert isinstance(opening_hours, tuple), 'Opening hours is expected to be a tuple.'
         assert len(opening_hours) == 2, 'Opening hours is expected to be a tuple with 2 values'
         _open = opening_hours[0]
         _close = opening_hours[1]
         assert isinstance(_open, (float, int)), 'Values in opening hours must be of type int or ' \
                                                 'float representing the hours of the day.'
-        assert isinstance(_open, (float, int)), 'Values in opening hours must be of type int or ' \
-                                                'float representing the hours of the day.'
+        assert isinstance(_close, (float, int)), 'Values in opening hours must be of type int ' \
+                                                 'or float representing the hours of the day.'
 
         assert _open <= _close, 'The first value (opening hour) is expected to be smaller than ' \
                                 'the 2nd value (closing hour).'
@@ -752,16 +879,17 @@ class ScenarioConfig:
 class ScenarioRealisation:
     """Describes a realisation based on the stochasticity of a ScenarioConfig."""
 
+    # Keys that must be passed to __init__ if no ScenarioConfig is given
+    _REQUIRED_KEYS = ('emissions_scenario', 'renewables_scenario', 'opening_hours',
+                      'infrastructure', 'scheduling_policy', 'queue_length',
+                      'disconnect_by_time', 'start_date', 'end_date', 'resolution')
+
     @staticmethod
     def check_input(**kwargs):
         """Check if all necessary keys are in kwargs of __init__."""
-        keys_necessary = ['emissions_scenario', 'renewables_scenario', 'opening_hours',
-                          'infrastructure', 'scheduling_policy', 'queue_length',
-                          'disconnect_by_time', 'start_date', 'end_date', 'resolution']
-
-        for key in keys_necessary:
-            assert key in kwargs, str(key) + ' is missing as an input to create a ' \
-                                             'ScenarioRealisation.'
+        missing = [key for key in ScenarioRealisation._REQUIRED_KEYS if key not in kwargs]
+        assert not missing, ', '.join(missing) + ' missing as an input to create a ' \
+                                                 'ScenarioRealisation.'
         return
 
     def __init__(self, config=None, **kwargs):
@@ -782,7 +910,7 @@ class ScenarioRealisation:
             # str
             if type(kwargs['start_date']) is str:
                 try:
-                    self.start_date = datetime.datetime.fromisoformat(kwargs['start_date'])
+                    self.start_date = _parse_datetime(kwargs['start_date'])
                 except ValueError:
                     print('Incorrect date format for start_date pls use: %y-%m-%d %H:%M:%S')
             # datetime.datetime
@@ -797,7 +925,7 @@ class ScenarioRealisation:
             # str
             if type(kwargs['end_date']) is str:
                 try:
-                    self.end_date = datetime.datetime.fromisoformat(kwargs['end_date'])
+                    self.end_date = _parse_datetime(kwargs['end_date'])
                 except ValueError:
                     print('Incorrect date format for end_date pls use: %y-%m-%d %H:%M:%S')
             # datetime.datetime
@@ -836,7 +964,10 @@ class ScenarioRealisation:
         # With ScenarioConfig instance
         if isinstance(config, ScenarioConfig):
             self.with_emissions_scenario(config.emissions_scenario,
-                                         self.start_date, self.end_date, self.resolution)
+                                         self.start_date, self.end_date, self.resolution,
+                                         config.emissions_scenario_col_pos,
+                                         config.emissions_scenario_res_data,
+                                         config.emissions_scenario_repeat)
             self.renewables_scenario = config.emissions_scenario
             self.with_opening_hours(config.opening_hours)
             self.infrastructure = config.infrastructure
@@ -860,13 +991,13 @@ class ScenarioRealisation:
             else:
                 if self.sample_method is None or self.sample_method == 'independent_normal_dist':
                     self.transform_arrival_distribution()
-                    time_steps = create_time_steps(self.start_date, self.end_date, self.resolution)
+                    time_steps = _time_steps(self.start_date, self.end_date, self.resolution)
                     self.charging_events = events_from_week_arr_dist(
                         config.arrival_distribution, time_steps, config.num_charging_events,
                         config.mean_park, config.std_deviation_park, config.mean_soc,
                         config.std_deviation_soc, config.vehicle_types, config.max_parking_time)
                 elif self.sample_method in ['GMM', 'gmm']:
-                    time_steps = create_time_steps(self.start_date, self.end_date, self.resolution)
+                    time_steps = _time_steps(self.start_date, self.end_date, self.resolution)
                     self.charging_events = events_from_gmm(
                         time_steps, config.num_charging_events, config.gmm_means,
                         config.gmm_weights, config.gmm_covariances, config.vehicle_types,
@@ -883,30 +1014,28 @@ class ScenarioRealisation:
             self.with_opening_hours(kwargs['opening_hours'])
             self.infrastructure = kwargs['infrastructure']
             self.with_scheduling_policy(kwargs['scheduling_policy'])
+            self.sample_method = kwargs.get('sample_method', 'independent_normal_dist')
 
             if 'df_charging_period' in kwargs.keys():
-                self.with_df_charging_period(kwargs['df_chaging_period'])
+                self.with_df_charging_period(kwargs['df_charging_period'])
             else:
                 self.df_charging_period = datetime.timedelta(minutes=15)
             self.queue_length = kwargs['queue_length']
             self.disconnect_by_time = kwargs['disconnect_by_time']
-            self.start_date = kwargs['start_date']
-            self.end_date = kwargs['end_date']
-            self.resolution = kwargs['resolution']
 
             if 'charging_events' in kwargs:
                 self.charging_events = [ChargingEvent.from_dict(**ce)
                                         for ce in kwargs['charging_events']]
             else:
                 if self.sample_method is None or self.sample_method == 'independent_normal_dist':
-                    time_steps = create_time_steps(self.start_date, self.end_date, self.resolution)
+                    time_steps = _time_steps(self.start_date, self.end_date, self.resolution)
                     self.charging_events = events_from_week_arr_dist(
                         kwargs['arrival_distribution'], time_steps, kwargs['num_charging_events'],
                         kwargs['mean_park'], kwargs['std_deviation_park'], kwargs['mean_soc'],
                         kwargs['std_deviation_soc'], kwargs['vehicle_types'],
                         kwargs['max_parking_time'])
                 elif self.sample_method in ['GMM', 'gmm']:
-                    time_steps = create_time_steps(self.start_date, self.end_date, self.resolution)
+                    time_steps = _time_steps(self.start_date, self.end_date, self.resolution)
                     self.charging_events = events_from_gmm(
                         time_steps, kwargs['num_charging_events'], kwargs['gmm_means'],
                         kwargs['gmm_weights'], kwargs['gmm_covariances'], kwargs['vehicle_types'],
@@ -931,7 +1060,13 @@ class ScenarioRealisation:
 
         return
 
-    def to_dict(self):
+    def to_dict(self, with_charging_events=True):
+        """Dict of all fields in plain types.
+
+        Args:
+            with_charging_events: (bool): If False the charging events are left out, e.g. to
+                write them one by one.
+        """
         dictionary = self.__dict__.copy()
 
         dictionary['scheduling_policy'] = str(self.scheduling_policy)
@@ -941,7 +1076,11 @@ class ScenarioRealisation:
         dictionary['renewables_scenario'] = self.renewables_scenario
 
         dictionary['opening_hours'] = self.opening_hours
-        dictionary['charging_events'] = [ce.to_dict(deep=True) for ce in self.charging_events]
+        if with_charging_events:
+            dictionary['charging_events'] = [ce.to_dict(deep=True)
+                                             for ce in self.charging_events]
+        else:
+            del dictionary['charging_events']
 
         dictionary['start_date'] = str(self.start_date.isoformat())
         dictionary['end_date'] = str(self.end_date.isoformat())
@@ -959,29 +1098,47 @@ class ScenarioRealisation:
 
     # https://stackoverflow.com/questions/39450065/python-3-read-write-compressed-json-objects-from-to-gzip-file
     def save_to_disk(self, file_path):
-        data = self.to_dict()
-
-        json_str = json.dumps(data)
-        json_bytes = json_str.encode('utf-8')
-
-        with gzip.GzipFile(file_path, 'w') as fout:
-            fout.write(json_bytes)
+        data = self.to_dict(with_charging_events=False)
+        encode = json.JSONEncoder(separators=(',', ':')).encode
+
+        # The file holds one JSON object, built from its encoded fields, so that the charging
+        # events can be encoded and written one by one and their dicts are never all held in
+        # memory. Encoding whole values with the C encoder is several times faster than
+        # json.dump, which writes every small chunk separately into the compressed stream.
+        # Compression level 6 is much faster than the default 9 for almost the same file size.
+        with gzip.open(file_path, 'wt', encoding='utf-8', compresslevel=6) as fout:
+            fout.write('{')
+            for key, value in data.items():
+                fout.write(encode(key) + ':' + encode(value) + ',')
+            fout.write('"charging_events":[')
+            separator = ''
+            for charging_event in self.charging_events:
+                fout.write(separator + encode(charging_event.to_dict(deep=True)))
+                separator = ','
+            fout.write(']}')
 
         return
 
     @staticmethod
     def from_disk(json_file_name):
-        with gzip.GzipFile(json_file_name, 'r') as fin:
-            json_bytes = fin.read()
-
-        json_str = json_bytes.decode('utf-8')
-        data = json.loads(json_str)
+        with gzip.open(json_file_name, 'rt', encoding='utf-8') as fin:
+            data = json.load(fin)
 
         return ScenarioRealisation.from_dict(data)
 
+    @property
+    def num_simulation_steps(self):
+        """Number of time steps in the simulation period of this realisation."""
+        return num_time_steps(self.start_date, self.end_date, self.resolution)
+
     def transform_arrival_distribution(self):
         pass
 
+    # Same validation as for the scenario configuration
+    with_scheduling_policy = ScenarioConfig.with_scheduling_policy
+    with_df_charging_period = ScenarioConfig.with_df_charging_period
+    with_opening_hours = ScenarioConfig.with_opening_hours
+
     def with_transformer_preload(self, transformer_preload, start_date, end_date, resolution,
                                  col_pos=0, res_data=None, repeat=False):
         """Update the renewable energy scenario to use.
@@ -1027,16 +1184,18 @@ class ScenarioRealisation:
             transformer_preload = transform_data(transformer_preload,
                                                  resolution, start_date, end_date)
         else:  # list or numeric
-            num_simulation_steps = int((self.end_date - self.start_date) / self.resolution) + 1
+            num_simulation_steps = num_time_steps(start_date, end_date, resolution)
 
             if isinstance(transformer_preload, (int, float)):
                 transformer_preload = [transformer_preload] * num_simulation_steps
 
-            assert type(transformer_preload) is list, msg_wrong_transformer_preload_type
+            assert isinstance(transformer_preload, (list, np.ndarray)), \
+                msg_wrong_transformer_preload_type
 
-            # Check if all values in list are either float or int
-            assert all(isinstance(x, (float, int)) for x in transformer_preload), \
-                msg_invalid_value_type
+            # Check if all values are either float or int. The array is used for the adjustments
+            # below and converted to a list only once at the end.
+            transformer_preload = _numeric_array(transformer_preload)
+            assert transformer_preload is not None, msg_invalid_value_type
 
             # Check whether the length of the list alignes with the simulation period and resolution
             # If num_values don't fit simulation period and no action is wanted return error
@@ -1058,7 +1217,7 @@ class ScenarioRealisation:
                 assert isinstance(res_data, datetime.timedelta), msg_wrong_resolution_type
 
                 transformer_preload = adjust_resolution(transformer_preload, res_data,
-                                                        self.resolution)
+                                                        resolution)
 
             if repeat is True:
                 transformer_preload = repeat_data(transformer_preload, num_simulation_steps)
@@ -1066,84 +1225,10 @@ class ScenarioRealisation:
             # Should it be ==?
             assert len(transformer_preload) >= num_simulation_steps, msg_alignement_unsuccessful
 
-        self.transformer_preload = transformer_preload
-
-        return self
-
-    def with_scheduling_policy(self, scheduling_policy_input):
-        """Update the scheduling policy to use.
-        Default: :obj: `elvis.sched.schedulers.Uncontrolled`.
-        Use default if input not a str or str can not be matched.
-
-        Args:
-            scheduling_policy_input: Either str containing name of the scheduling policy to be used.
-                Or instance of :obj: `elvis.sched.schedulers.SchedulingPolicy`.
-        """
-        # set default
-        scheduling_policy = schedulers.Uncontrolled()
-
-        # if input is already instance of Scheduling Policy assign
-        if isinstance(scheduling_policy_input, schedulers.SchedulingPolicy):
-            self.scheduling_policy = scheduling_policy_input
-            return self
-
-        # ensure input is str. If not return default
-        if type(scheduling_policy_input) is not str:
-            logging.error('Scheduling policy should be of type str or an instance of '
-                          'SchedulingPolicy. The uncontrolled strategy has been used as a default.')
-            self.scheduling_policy = scheduling_policy
-            return self
-
-        # Match string
-        if scheduling_policy_input in ('Uncontrolled', 'UC', 'Uc', 'uc'):
-            self.scheduling_policy = schedulers.Uncontrolled()
-
-        elif scheduling_policy_input in ('Discrimination Free', 'DF', 'df'):
-            self.scheduling_policy = schedulers.DiscriminationFree()
-
-        elif scheduling_policy_input == 'FCFS':
-            self.scheduling_policy = schedulers.FCFS()
+            # The preload is read value by value during the simulation
+            transformer_preload = transformer_preload.tolist()
 
-        elif scheduling_policy_input in ('With Storage', 'ws', 'WS'):
-            self.scheduling_policy = schedulers.WithStorage()
-
-        elif scheduling_policy_input in ('Optimized', 'opt', 'OPT'):
-            self.scheduling_policy = schedulers.Optimized()
-
-        # invalid str use default: Uncontrolled
-        else:
-            logging.error('"%s" can not be matched to any existing scheduling policy.'
-                          'Please use: "Uncontrolled", "Discrimination Free", "FCFS", '
-                          '"With Storage" or "Optimized". '
-                          'Uncontrolled is the default value and has been used for the simulation.',
-                          str(scheduling_policy_input))
-
-            self.scheduling_policy = schedulers.Uncontrolled()
-        return self
-
-    def with_df_charging_period(self, charging_period):
-
-        assert isinstance(charging_period, (str, datetime.timedelta)), (
-            'Charging period must either be a str in format: %H:%M:%S or an instance '
-            'of datetime.timedelta')
-
-        # str
-        if type(charging_period) is str:
-            try:
-                date = datetime.datetime.strptime(charging_period, '%H:%M:%S')
-                self.df_charging_period = datetime.timedelta(hours=date.hour,
-                                                             minutes=date.minute,
-                                                             seconds=date.second)
-            except ValueError:
-                try:
-                    seconds = pd.Timedelta(charging_period).total_seconds()
-                    self.df_charging_period = datetime.timedelta(seconds=seconds)
-                except ValueError:
-                    print('Incorrect timedelta format for resolution pls use: %H:%M:%S or '
-                          'a pandas conform timedelta format.')
-        # datetime.timedelta
-        else:
-            self.df_charging_period = charging_period
+        self.transformer_preload = transformer_preload
 
         return self
 
@@ -1186,8 +1271,6 @@ class ScenarioRealisation:
         msg_not_enough_data_points = "There are less values for the transformer preload than " \
                                      "simulation steps. Please adjust the data."
 
-        emissions_scenario_aligned = []
-
         # Constant value
         if isinstance(emissions_scenario, (float, int)):
             self.emissions_scenario = [emissions_scenario] * \
@@ -1197,23 +1280,24 @@ class ScenarioRealisation:
         elif isinstance(emissions_scenario, pd.DataFrame):
             emissions_scenario = emissions_scenario.iloc[:, col_pos]
 
-            emissions_scenario_aligned = transform_data(emissions_scenario,
-                                                        resolution, start_date, end_date)
+            self.emissions_scenario = transform_data(emissions_scenario,
+                                                     resolution, start_date, end_date)
         elif isinstance(emissions_scenario, pd.Series):
-            emissions_scenario_aligned = transform_data(emissions_scenario,
-                                                        resolution, start_date, end_date)
+            self.emissions_scenario = transform_data(emissions_scenario,
+                                                     resolution, start_date, end_date)
         elif isinstance(emissions_scenario, list):
             num_simulation_steps = num_time_steps(start_date, end_date, resolution)
 
-            # Check if all values in list are either float or int
-            assert all(isinstance(x, (float, int)) for x in emissions_scenario), \
-                msg_invalid_value_type
+            # Check if all values in list are either float or int. The array is used for the
+            # adjustments below and converted to a list only once at the end.
+            emissions_scenario = _numeric_array(emissions_scenario)
+            assert emissions_scenario is not None, msg_invalid_value_type
 
             # Check whether the length of the list alignes with the simulation period and resolution
             # If num_values don't fit simulation period and no action is wanted return error
             num_values = len(emissions_scenario)
 
-            assert num_simulation_steps < num_values or res_data is not None or repeat, \
+            assert num_simulation_steps <= num_values or res_data is not None or repeat, \
                 msg_not_enough_data_points
 
             if res_data is not None:
@@ -1229,42 +1313,17 @@ class ScenarioRealisation:
                 assert isinstance(res_data, datetime.timedelta), msg_wrong_resolution_type
 
                 emissions_scenario = adjust_resolution(emissions_scenario, res_data,
-                                                       self.resolution)
+                                                       resolution)
 
             if repeat is True:
                 emissions_scenario = repeat_data(emissions_scenario, num_simulation_steps)
 
             # Should it be ==?
             assert len(emissions_scenario) >= num_simulation_steps, msg_alignment_unsuccessful
+            self.emissions_scenario = emissions_scenario.tolist()
         else:
             warnings.warn('Emissions are passed in an non convertible type. Please either use:'
                           'Float/int, list or pandas Series or DataFrame. The simulation is carried'
                           ' on without assigning emission values.')
 
-        return emissions_scenario_aligned
-
-    def with_opening_hours(self, opening_hours):
-        """Update the opening hours to use."""
-
-        if opening_hours is None:
-            self.opening_hours = opening_hours
-            return self
-
-        assert isinstance(opening_hours, tuple), 'Opening hours is expected to be a tuple.'
-        assert len(opening_hours) == 2, 'Opening hours is expected to be a tuple with 2 values'
-        _open = opening_hours[0]
-        _close = opening_hours[1]
-        assert isinstance(_open,
-                          (float, int)), 'Values in opening hours must be of type int or ' \
-                                         'float representing the hours of the day.'
-        assert isinstance(_open,
-                          (float, int)), 'Values in opening hours must be of type int or ' \
-                                         'float representing the hours of the day.'
-
-        assert _open <= _close, 'The first value (opening hour) is expected to be smaller than ' \
-                                'the 2nd value (closing hour).'
-        assert _close <= 24, 'The last value(closing hour) is expected to be smaller or equal to 24'
-        assert _open >= 0, 'The first value(opening hour) is expected to be bigger or equal to 0'
-
-        self.opening_hours = opening_hours
         return self
@@ -1,6 +1,8 @@
 
 import math
 
+import numpy as np
+
 
 class Distribution:
     """Represents a distribution of some x value to a y value."""
@@ -112,15 +114,38 @@ class EquallySpacedInterpolatedDistribution(Distribution):
         self.interpolate = interpolate
         self.distance_between_points = abs(points[1][0] - points[0][0])
 
+        # x and y values as arrays for the vectorized evaluation in __call__
+        points_array = np.asarray(points, dtype=float)
+        self._xp = points_array[:, 0]
+        self._fp = points_array[:, 1]
+
     @staticmethod
     def linear(points, bounds):
         return EquallySpacedInterpolatedDistribution(points, bounds, InterpolatedDistribution._linear_interpolation)
 
+    def __call__(self, xs):
+        """Evaluates the distribution at all x values at once. Values outside of the points are
+        clamped to the first respectively last y value, the same as in __getitem__.
+
+        Args:
+            xs: (array_like): x values to evaluate the distribution at.
+
+        Returns:
+            :obj: `numpy.ndarray`: y values.
+        """
+        if self.interpolate is InterpolatedDistribution._linear_interpolation:
+            return np.interp(xs, self._xp, self._fp)
+
+        return np.array([self[x] for x in np.asarray(xs).ravel()]).reshape(np.shape(xs))
+
     @staticmethod
     def _linear_interpolation(y0, y1, offset):
         return y0 + (y1 - y0) * offset
 
     def __getitem__(self, key):
+        if isinstance(key, np.ndarray):
+            return self(key)
+
         if key < self.points[0][0]:
             return self.points[0][1]
 
@@ -1,14 +1,20 @@
 """Super class for every node in the infrastructure network.
 TODO: Add node busbar."""
 
-import networkx as nx
-import matplotlib.pyplot as plt
+import itertools
+
+import numpy as np
 from math import floor
 from elvis.battery import StationaryBattery
 
 
 class InfrastructureNode:
     """Super class of all nodes (transformer, charging station, charging point)."""
+
+    __slots__ = ('id', 'min_power', 'max_power', 'parent', 'children', 'leafs', 'leaf_id',
+                 '_leaf_idx', 'ancestor_pos', 'node_max_powers', '_leaf_of_pair',
+                 '_node_of_pair')
+
     def __init__(self, identification, min_power, max_power,
                  parent=None):
         """Create an InfrastructureNode given all parameters.
@@ -42,6 +48,16 @@ class InfrastructureNode:
             parent.add_child(self)
         self.children = []
         self.leafs = None
+        # Position of the node in the power arrays of the infrastructure if it is a leaf
+        self.leaf_id = None
+        # Positions of all leafs below the node, see set_up_leafs
+        self._leaf_idx = None
+        # Positions of all nodes above a leaf in the node_max_powers of the root node
+        self.ancestor_pos = None
+        self.node_max_powers = None
+        # Every (leaf, ancestor) pair below the root node, see headrooms
+        self._leaf_of_pair = None
+        self._node_of_pair = None
 
     def add_child(self, child):
         """Add child to list of all children."""
@@ -51,6 +67,10 @@ class InfrastructureNode:
 
     def draw_infrastructure(self):
         """Displays a window with a graph of the infrastructure."""
+        # Only needed for drawing and slow to import
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
         graph = nx.Graph()
 
         # find transformer as the root of the tree
@@ -93,15 +113,90 @@ class InfrastructureNode:
 
     def set_up_leafs(self):
         self.leafs = self.get_leaf_nodes()
+        # Number the leafs so the power assigned to them can be stored in an array
+        for leaf_id, leaf in enumerate(self.leafs):
+            leaf.leaf_id = leaf_id
+        self._leaf_idx = None
 
         def _set_up_leafs(node):
             if len(node.children) == 0:
                 return
             for n in node.children:
                 n.leafs = n.get_leaf_nodes()
+                n._leaf_idx = None
                 _set_up_leafs(n)
         _set_up_leafs(self)
 
+        # Max power of all nodes with children, root first, so the headroom of every node can be
+        # kept in one array while power is assigned to the leafs
+        nodes = [self]
+        for node in nodes:
+            nodes.extend(n for n in node.children if len(n.children) > 0)
+        positions = {node: pos for pos, node in enumerate(nodes)}
+        self.node_max_powers = np.array([node.max_power for node in nodes], dtype=np.float64)
+        for leaf in self.leafs:
+            ancestors = []
+            parent = leaf.parent
+            while parent is not None and parent in positions:
+                ancestors.append(positions[parent])
+                parent = parent.parent
+            leaf.ancestor_pos = np.array(ancestors, dtype=np.int32)
+
+        power_leafs = [leaf for leaf in self.leafs if not isinstance(leaf, Storage)]
+        self._leaf_of_pair = np.repeat(
+            np.array([leaf.leaf_id for leaf in power_leafs], dtype=np.int32),
+            [len(leaf.ancestor_pos) for leaf in power_leafs])
+        self._node_of_pair = np.concatenate(
+            [leaf.ancestor_pos for leaf in power_leafs] + [np.zeros(0, dtype=np.int32)])
+
+    def headrooms(self, power_assigned=None):
+        """Calculate the power that can still be assigned to every node with children. Must be
+            called on the node set_up_leafs has been called on.
+
+            Args:
+                power_assigned: (:obj: `numpy.ndarray`): Power assigned to all leafs ordered by
+                    their leaf_id. If None no power has been assigned yet.
+
+            Returns:
+                headrooms: (:obj: `numpy.ndarray`): Max power minus the power assigned to the
+                    leafs below for every node, in the order of node_max_powers.
+        """
+        if power_assigned is None:
+            return self.node_max_powers.copy()
+
+        assigned = np.bincount(self._node_of_pair, weights=power_assigned[self._leaf_of_pair],
+                               minlength=len(self.node_max_powers))
+        return self.node_max_powers - assigned
+
+    @property
+    def leaf_idx(self):
+        """Leaf ids of all leafs below the node that draw power through it. Created on first use
+        after set_up_leafs."""
+        if self._leaf_idx is None:
+            self._leaf_idx = np.fromiter((leaf.leaf_id for leaf in self.leafs
+                                          if not isinstance(leaf, Storage)), dtype=np.int32)
+        return self._leaf_idx
+
+    def power_assigned_to_leafs(self, power_assigned):
+        """Sum the power assigned to all leafs below the node (storage systems excluded).
+
+        Args:
+            power_assigned: (dict or :obj: `numpy.ndarray`): Either containing all
+                :obj: `charging_point.ChargingPoint` in the infrastructure and their currently
+                assigned power or the assigned power of all leafs ordered by their leaf_id.
+
+        Returns:
+            power: (float): Power assigned to the leafs of the node.
+        """
+        if isinstance(power_assigned, np.ndarray):
+            return float(power_assigned[self.leaf_idx].sum())
+
+        power = 0
+        for leaf in self.leafs:
+            if not isinstance(leaf, Storage):
+                power += power_assigned[leaf]
+        return power
+
     def get_transformer(self):
         parent = self
         go_on = True
@@ -120,12 +215,15 @@ class InfrastructureNode:
 class Transformer(InfrastructureNode):
     """Represents a transformer. No usability besides having a max and min power.
     Does not have a parent node in infrastructure."""
-    counter = 1
+
+    __slots__ = ()
+
+    # static id generator, advanced by 1 for every __init__
+    counter = itertools.count(1)
 
     def __init__(self, min_power, max_power):
 
-        identification = 'Transformer_' + str(Transformer.counter)
-        Transformer.counter += 1
+        identification = 'Transformer_' + str(next(Transformer.counter))
 
         super().__init__(identification, min_power, max_power)
 
@@ -137,17 +235,15 @@ class Transformer(InfrastructureNode):
             assigned power.
 
             Args:
-                power_assigned: (dict): Containing all :obj: `charging_point.ChargingPoint`
-                    in the infrastructure and their currently assigned power.
+                power_assigned: (dict or :obj: `numpy.ndarray`): Containing all
+                    :obj: `charging_point.ChargingPoint` in the infrastructure and their currently
+                    assigned power or the assigned power of all leafs ordered by leaf_id.
                 preload: (float): Preload at the transformer in kWh.
 
             Returns:
                 max_power: (float): Max power that can be assigned to the transformer.
         """
-        power_already_assigned = preload
-        for leaf in self.leafs:
-            if not isinstance(leaf, Storage):
-                power_already_assigned += power_assigned[leaf]
+        power_already_assigned = preload + self.power_assigned_to_leafs(power_assigned)
 
         max_power = max(self.max_power - power_already_assigned, 0)
         max_power = floor(max_power * 1000) / 1000
@@ -156,8 +252,10 @@ class Transformer(InfrastructureNode):
 
 
 class Storage(InfrastructureNode):
-    # ID counter
-    counter = 1
+    __slots__ = ('storage',)
+
+    # ID counter, advanced by 1 for every __init__
+    counter = itertools.count(1)
 
     def __init__(self, stationary_battery, transformer):
         assert isinstance(stationary_battery, StationaryBattery)
@@ -168,7 +266,6 @@ class Storage(InfrastructureNode):
         min_power = self.storage.min_charge_power
 
         # ID
-        identification = 'Storage_System ' + str(Storage.counter)
-        Storage.counter += 1
+        identification = 'Storage_System ' + str(next(Storage.counter))
 
         super().__init__(identification, max_power, min_power, parent=transformer)
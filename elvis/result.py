@@ -3,7 +3,7 @@ from datetime import timedelta
 import numpy as np
 from elvis.charging_point import ChargingPoint
 from elvis.config import ScenarioRealisation
-from elvis.utility.elvis_general import num_time_steps, create_time_steps
+from elvis.utility.elvis_general import create_time_steps
 from elvis.distribution import EquallySpacedInterpolatedDistribution
 from elvis.infrastructure_node import Storage
 
@@ -105,8 +105,7 @@ class ElvisResult:
                                               'field result.scenario must be set to the scenario ' \
                                               'realisation.'
 
-            num_simulation_steps = num_time_steps(self.scenario.start_date, self.scenario.end_date,
-                                                  self.scenario.resolution)
+            num_simulation_steps = self.scenario.num_simulation_steps
         load_profile = []
         power = {}
         for time_step in range(num_simulation_steps):
@@ -128,8 +127,7 @@ class ElvisResult:
                                               'field result.scenario must be set to the scenario ' \
                                               'realisation.'
 
-            num_simulation_steps = num_time_steps(self.scenario.start_date, self.scenario.end_date,
-                                                  self.scenario.resolution)
+            num_simulation_steps = self.scenario.num_simulation_steps
         storage_profile = []
         power = {}
         for time_step in range(num_simulation_steps):
@@ -199,8 +197,7 @@ class ElvisResult:
             assert self.scenario is not None, 'To calculate the simultaneity_factor the ' \
                                                'aggregated load profile must be calculated.'
 
-            time_steps = num_time_steps(self.scenario.start_date, self.scenario.end_date,
-                                        self.scenario.resolution)
+            time_steps = self.scenario.num_simulation_steps
 
             self.aggregate_load_profile(time_steps)
         assert self.aggregated_load_profile is not None, 'Before calculating KPIs the aggregated' \
@@ -1,5 +1,8 @@
 """ """
-from elvis.infrastructure_node import Transformer, Storage
+import numpy as np
+
+from elvis.battery import Battery
+from elvis.infrastructure_node import Storage
 from elvis.charging_point import ChargingPoint
 from elvis.utility.elvis_general import floor
 
@@ -61,14 +64,18 @@ class Uncontrolled(SchedulingPolicy):
 
         total_power = 0
 
+        # Max power the batteries can charge with at current SOC
+        busy_cps = list(busy_cps)
+        batteries = [cp.connected_vehicle.vehicle_type.battery for cp in busy_cps]
+        max_power_batteries = Battery.max_power_possible_vec(
+            [cp.connected_vehicle.soc for cp in busy_cps],
+            [battery.max_charge_power for battery in batteries],
+            [battery.start_power_degradation for battery in batteries],
+            [battery.max_degradation_level for battery in batteries]).tolist()
+
         # For all charging points with a connected vehicle assign max possible power
-        for cp in busy_cps:
+        for cp, max_power_battery in zip(busy_cps, max_power_batteries):
             power_cp = cp.max_power
-            connected_vehicle = cp.connected_vehicle
-            soc = connected_vehicle['soc']
-            battery = connected_vehicle['vehicle_type'].battery
-            # Max power the battery can charge with at current SOC
-            max_power_battery = battery.max_power_possible(soc)
             # Power needed to fully charge battery
             power_to_charge_full = cp.power_to_charge_target(resolution, 1.0)
             # Get the stricter constraint
@@ -79,7 +86,7 @@ class Uncontrolled(SchedulingPolicy):
         # If power assigned is higher than transformer limit
         if storage_system is not None:
             if total_power > transformer.max_power:
-                max_storage = storage_system.storage.max_discharge_power(0, resolution)
+                max_storage = storage_system.storage.max_discharge_power(0)
                 # The power from the storage system is not able to cover the whole transformer overhead
                 if max_storage < total_power - transformer.max_power:
                     assign_power['storage'][storage_system] = - max_storage
@@ -112,7 +119,7 @@ class FCFS(SchedulingPolicy):
 
         # All charging points with a connected vehicle assign max possible power
         sorted_busy_cps = list(busy_cps)
-        sorted_busy_cps.sort(key=lambda x: x.connected_vehicle['leaving_time'])
+        sorted_busy_cps.sort(key=lambda x: x.connected_vehicle.leaving_time)
 
         # Get transformer and storage system
         storage_system = SchedulingPolicy.get_storage_system(free_cps, busy_cps)
@@ -123,39 +130,35 @@ class FCFS(SchedulingPolicy):
         # Sum all power that is assigned in order to identify which power must be delivered by
         # the storage based on the initial transformer maximum
         total_power_assigned = 0
-        max_power_transformer_0 = transformer.max_hardware_power(assign_power['cps'], preload)
+        # Power still assignable to every node above the charging points, root (transformer) first.
+        # Reduced by the power assigned to a charging point so no node has to sum its leafs.
+        headrooms = transformer.headrooms()
+        max_power_transformer_0 = floor(max(headrooms[0] - preload, 0))
         power_storage = 0
         max_power_storage = 0
 
-        for cp in sorted_busy_cps:
+        # Power to fully charge each vehicle within the time step floored to 3 decimals
+        powers_to_charge_full = np.floor(ChargingPoint.powers_to_charge_target(
+            sorted_busy_cps, resolution, 1.0) * 1000) / 1000
+
+        for cp, power_to_charge_full in zip(sorted_busy_cps, powers_to_charge_full.tolist()):
             # check what the max power possible from vehicle to grid is based on hardware
             # and the already assigned power of every component (node)
             max_hardware_power = cp.max_hardware_power()
-            parent = cp
-            go_on = True
-            while go_on is True:
-                if parent.parent is not None:
-                    parent = parent.parent
-                    # If the parent is the Transformer: Also pass preload
-                    if isinstance(parent, Transformer):
-                        max_power_transformer = parent.max_hardware_power(assign_power['cps'],
-                                                                          preload)
-                        if storage_system is not None:
-                            max_power_storage = \
-                                storage_system.storage.max_discharge_power(power_storage,
-                                                                           resolution)
-                            power_available = max_power_transformer + max_power_storage
-                        else:
-                            power_available = max_power_transformer
-                        power_available = floor(power_available)
-                        max_hardware_power = min(max_hardware_power, power_available)
-                    else:
-                        max_hardware_power = min(max_hardware_power,
-                                                 parent.max_hardware_power(assign_power['cps']))
-                else:
-                    go_on = False
+            ancestor_pos = cp.ancestor_pos
+            # Nodes between charging point and transformer
+            for pos in ancestor_pos[:-1].tolist():
+                max_hardware_power = min(max_hardware_power, floor(headrooms[pos]))
+            # Transformer: Also consider preload and storage
+            max_power_transformer = floor(max(headrooms[0] - preload, 0))
+            if storage_system is not None:
+                max_power_storage = storage_system.storage.max_discharge_power(power_storage)
+                power_available = max_power_transformer + max_power_storage
+            else:
+                power_available = max_power_transformer
+            power_available = floor(power_available)
+            max_hardware_power = min(max_hardware_power, power_available)
 
-            power_to_charge_full = floor(cp.power_to_charge_target(resolution, 1.0))
             power = min(power_to_charge_full, max_hardware_power)
             total_power_assigned += power
             if total_power_assigned > max_power_transformer_0 and max_power_storage != 0:
@@ -163,6 +166,7 @@ class FCFS(SchedulingPolicy):
                 power_storage = floor(power_storage)
 
             assign_power['cps'][cp] = power
+            headrooms[ancestor_pos] -= power
         if storage_system is not None:
             assign_power['storage'][storage_system] = -power_storage
 
@@ -202,39 +206,35 @@ class DiscriminationFree(SchedulingPolicy):
         # Sum all power that is assigned in order to identify which power must be delivered by
         # the storage based on the initial transformer maximum
         total_power_assigned = 0
-        max_power_transformer_0 = transformer.max_hardware_power(assign_power['cps'], preload)
+        # Power still assignable to every node above the charging points, root (transformer) first.
+        # Reduced by the power assigned to a charging point so no node has to sum its leafs.
+        headrooms = transformer.headrooms()
+        max_power_transformer_0 = floor(max(headrooms[0] - preload, 0))
         power_storage = 0
         max_power_storage = 0
 
-        for cp in sorted_busy_cps:
+        # Power to fully charge each vehicle within the time step floored to 3 decimals
+        powers_to_charge_full = np.floor(ChargingPoint.powers_to_charge_target(
+            sorted_busy_cps, resolution, 1.0) * 1000) / 1000
+
+        for cp, power_to_charge_full in zip(sorted_busy_cps, powers_to_charge_full.tolist()):
             # check what the max power possible from vehicle to grid is based on hardware
             # and the already assigned power of every component (node)
             max_hardware_power = cp.max_hardware_power()
-            parent = cp
-            go_on = True
-            while go_on is True:
-                if parent.parent is not None:
-                    parent = parent.parent
-                    # If the parent is the Transformer: Also pass preload
-                    if isinstance(parent, Transformer):
-                        max_power_transformer = parent.max_hardware_power(assign_power['cps'],
-                                                                          preload)
-                        if storage_system is not None:
-                            max_power_storage = \
-                                storage_system.storage.max_discharge_power(power_storage,
-                                                                           resolution)
-                            power_available = max_power_transformer + max_power_storage
-                        else:
-                            power_available = max_power_transformer
-                        power_available = floor(power_available)
-                        max_hardware_power = min(max_hardware_power, power_available)
-                    else:
-                        max_hardware_power = min(max_hardware_power,
-                                                 parent.max_hardware_power(assign_power['cps']))
-                else:
-                    go_on = False
+            ancestor_pos = cp.ancestor_pos
+            # Nodes between charging point and transformer
+            for pos in ancestor_pos[:-1].tolist():
+                max_hardware_power = min(max_hardware_power, floor(headrooms[pos]))
+            # Transformer: Also consider preload and storage
+            max_power_transformer = floor(max(headrooms[0] - preload, 0))
+            if storage_system is not None:
+                max_power_storage = storage_system.storage.max_discharge_power(power_storage)
+                power_available = max_power_transformer + max_power_storage
+            else:
+                power_available = max_power_transformer
+            power_available = floor(power_available)
+            max_hardware_power = min(max_hardware_power, power_available)
 
-            power_to_charge_full = floor(cp.power_to_charge_target(resolution, 1.0))
             power = min(power_to_charge_full, max_hardware_power)
             total_power_assigned += power
             if total_power_assigned > max_power_transformer_0 and max_power_storage != 0:
@@ -248,6 +248,7 @@ class DiscriminationFree(SchedulingPolicy):
                 self.state[cp]['times_charged'] = self.state[cp]['times_charged'] + 1
 
             assign_power['cps'][cp] = power
+            headrooms[ancestor_pos] -= power
         if storage_system is not None:
             assign_power['storage'][storage_system] = -power_storage
 
@@ -296,24 +297,24 @@ class DiscriminationFree(SchedulingPolicy):
                 else:
                     state_id = self.state[cp]['id']
                     look_up_cps = list(cps)
-                    vehicle_id = look_up_cps[look_up_cps.index(cp)].connected_vehicle['id']
+                    vehicle_id = look_up_cps[look_up_cps.index(cp)].connected_vehicle.id
 
                     # update car if it changed
-                    if state_id is not vehicle_id:
+                    if state_id != vehicle_id:
                         self.state[cp]['id'] = vehicle_id
                         self.state[cp]['times_charged'] = 0
 
             # check that state has all cars currently connected
             for cp in cps:
                 if cp not in state_keys:
-                    self.state[cp] = {'id': cp.connected_vehicle['id'],
+                    self.state[cp] = {'id': cp.connected_vehicle.id,
                                       'times_charged': 0}
 
         else:  # will only be called once for initialisation
             self.state = dict()
             for cp in cps:
 
-                self.state[cp] = {'id': cp.connected_vehicle['id'],
+                self.state[cp] = {'id': cp.connected_vehicle.id,
                                   'times_charged': 0}
 
         return
@@ -12,6 +12,7 @@ from elvis.waiting_queue import WaitingQueue
 from elvis.result import ElvisResult
 from elvis.config import ScenarioRealisation, ScenarioConfig
 from elvis.infrastructure_node import Storage
+from elvis.charging_point import ChargingPoint
 
 
 def handle_car_arrival(free_cps, busy_cps, event, waiting_queue, counter_rejections,
@@ -131,7 +132,7 @@ def update_cps(free_cps, busy_cps,
         for cp in busy_cps:
             connected_vehicle = cp.connected_vehicle
 
-            if connected_vehicle['leaving_time'] <= current_time_step:
+            if connected_vehicle.leaving_time <= current_time_step:
                 if log:
                     logging.info(' Disconnect: %s', cp)
                 cp.disconnect_vehicle()
@@ -155,8 +156,8 @@ def update_cps(free_cps, busy_cps,
         for cp in busy_cps:
             connected_vehicle = cp.connected_vehicle
 
-            soc = connected_vehicle['soc']
-            soc_target = connected_vehicle['soc_target']
+            soc = connected_vehicle.soc
+            soc_target = connected_vehicle.soc_target
 
             if round(soc, 3) >= soc_target:
                 if log:
@@ -191,29 +192,29 @@ def charge_connected_vehicles(assign_power_cps, busy_cps, res, log):
     Returns: None
     """
 
-    for cp in busy_cps:
-        power = assign_power_cps[cp]
-        vehicle = cp.connected_vehicle
-        soc_before = vehicle['soc']
-        if vehicle is None:
-            raise TypeError
+    busy_cps = list(busy_cps)
+    powers = [assign_power_cps[cp] for cp in busy_cps]
+    if log:
+        socs_before = [cp.connected_vehicle.soc for cp in busy_cps]
 
-        cp.charge_vehicle(power, res)
+    ChargingPoint.charge_vehicles(busy_cps, powers, res)
 
-        if log:
+    if log:
+        for cp, power, soc_before in zip(busy_cps, powers, socs_before):
             logging.info('At charging point %s the vehicle SOC has been charged from %s to %s. '
-                         'The power assigned is: %s', cp, soc_before, vehicle['soc'],
+                         'The power assigned is: %s', cp, soc_before, cp.connected_vehicle.soc,
                          str(power))
 
 
-def charge_storage(assign_power, preload, step_length):
+def charge_storage(assign_power, preload, step_length=None):
     """Charges/discharges the storage and returns the realised (dis)charging power.
 
     Args:
         assign_power: (dict): power assigned to storage and cps
         preload: (float): Preload at current time step.
         step_length: (:obj: `datetime.timedelta`): Resolution of the simulation denoting the
-                time in between two adjacent time steps.
+                time in between two adjacent time steps. If None the step length set by
+                set_step_hours of the storage systems is used.
     Returns:
         assign_power: (dict): keys=storage, value=realised power
 
@@ -260,7 +261,7 @@ def update_last_charged(charging_times, assign_power_cps, time_step):
 
     charging_times_updated = charging_times
     for cp in cps_with_power:
-        ce = cp.connected_vehicle['id']
+        ce = cp.connected_vehicle.id
         if ce not in charging_times_updated:
             charging_times_updated[ce] = {'arrival': time_step, 'last_charged': time_step}
         else:
@@ -332,6 +333,13 @@ def simulate_async(scenario, results, start_date=None, end_date=None, resolution
     # set up infrastructure and get all charging points
     free_cps = set(set_up_infrastructure(scenario.infrastructure))
     busy_cps = set()
+    # Preallocate the SOC log of all storage systems and set their step length once
+    step_hours = scenario.resolution.total_seconds() / 3600
+    for transformer in {cp.get_transformer() for cp in free_cps}:
+        for node in transformer.children:
+            if isinstance(node, Storage):
+                node.storage.allocate(len(time_steps))
+                node.storage.set_step_hours(step_hours)
     # Rejections counter
     counter_rejections = 0
     # Charging times tracker
@@ -381,8 +389,7 @@ def simulate_async(scenario, results, start_date=None, end_date=None, resolution
             charging_periods = update_last_charged(charging_periods, assign_power['cps'], time_step)
 
         charge_connected_vehicles(assign_power['cps'], busy_cps, scenario.resolution, log)
-        charge_storage(assign_power, scenario.transformer_preload[time_step_pos],
-                       scenario.resolution)
+        charge_storage(assign_power, scenario.transformer_preload[time_step_pos])
         results.store_power_charging_points(assign_power['cps'], time_step_pos,
                                             time_step_pos == total_time_steps-1)
         results.store_power_storage_systems(assign_power['storage'], time_step_pos,
@@ -2,10 +2,9 @@
 
 import datetime
 import math
+import numpy as np
 import pandas as pd
 
-from elvis.distribution import EquallySpacedInterpolatedDistribution
-
 
 def create_time_steps(start_date, end_date, resolution):
     """Create list from start, end date and resolution of the simulation period with all individual
@@ -20,14 +19,12 @@ def create_time_steps(start_date, end_date, resolution):
         time_steps: (list): Contains time_steps in `datetime.datetime` format
 
     """
-    # Create list containing all time steps as datetime.datetime object
-    time_step = start_date
-    time_steps = []
-    while time_step <= end_date:
-        time_steps.append(time_step)
-        time_step += resolution
+    # Create all time steps at once in microsecond resolution and convert them back to a list of
+    # datetime.datetime objects
+    offsets = np.arange(num_time_steps(start_date, end_date, resolution)) * \
+        np.timedelta64(resolution, 'us')
 
-    return time_steps
+    return (np.datetime64(start_date, 'us') + offsets).tolist()
 
 
 def num_time_steps(start_date, end_date, resolution):
@@ -200,31 +197,44 @@ def adjust_resolution(preload, res_data, res_simulation):
     """Adjusts res_data of the transformer preload to the simulation res_data.
 
     Args:
-        preload: (list): Containing the transformer preload in "wrong"
-            res_data.
+        preload: (list, :obj: `numpy.ndarray` or :obj: `pandas.DataFrame`): Containing the
+            transformer preload in "wrong" res_data. All columns of a DataFrame are adjusted at
+            once.
         res_data: (datetime.timedelta): Time in between two adjacent data points of
             transformer preload with "wrong" res_data.
         res_simulation: (datetime.timedelta): Time in between two adjacent time steps in
             the simulation.
 
     Returns:
-        transformer_preload_new_res: (list): Transformer preload with linearly interpolated data
-            points having the res_data of the simulation.
+        transformer_preload_new_res: (list, :obj: `numpy.ndarray` or :obj: `pandas.DataFrame`):
+            Transformer preload with linearly interpolated data points having the res_data of
+            the simulation. Of the same type as preload.
         """
 
-    x_values = list(range(len(preload)))
-    distribution = EquallySpacedInterpolatedDistribution.linear(
-        list(zip(x_values, preload)), None)
-
     coefficient = res_simulation / res_data
-    x_values_new_res = list(range(math.ceil(len(preload) * 1 / coefficient)))
-    x_values_new_res = [x * coefficient for x in x_values_new_res]
+    # Data already in the resolution of the simulation
+    if coefficient == 1:
+        return preload.copy()
+
+    # Positions of the new time steps in units of the data points. np.interp clamps positions
+    # after the last data point to its value.
+    x_values_new_res = np.arange(math.ceil(len(preload) / coefficient)) * coefficient
 
-    transformer_preload_new_res = []
-    for x in x_values_new_res:
-        transformer_preload_new_res.append(distribution[x])
+    if isinstance(preload, pd.DataFrame):
+        values = preload.to_numpy(dtype=np.float64)
+        # np.interp is 1-D only. Interpolate all columns at once from the data point before
+        # each new position and the weight of the one after it, clamped like np.interp.
+        idx = np.minimum(x_values_new_res.astype(np.intp), len(values) - 2)
+        weights = np.minimum(x_values_new_res - idx, 1.)[:, np.newaxis]
+        values_new_res = values[idx] * (1 - weights) + values[idx + 1] * weights
+        return pd.DataFrame(values_new_res, columns=preload.columns)
 
-    return transformer_preload_new_res
+    transformer_preload_new_res = np.interp(x_values_new_res, np.arange(len(preload)),
+                                            np.asarray(preload, dtype=np.float64))
+
+    if isinstance(preload, np.ndarray):
+        return transformer_preload_new_res
+    return transformer_preload_new_res.tolist()
 
 
 def repeat_data(preload, num_simulation_steps):
@@ -232,23 +242,25 @@ def repeat_data(preload, num_simulation_steps):
     simulation steps.
 
     Args:
-        preload: (list): Containing the data (floats) to be repeated.
+        preload: (list or :obj: `numpy.ndarray`): Containing the data (floats) to be repeated.
         num_simulation_steps: (int): Number of simulation steps and expected length of
             the transformer preload after it is repeated.
 
     Returns:
-        transformer_preload_repeated: (list): Repeated values. len() = num_simulation_steps.
+        transformer_preload_repeated: (list or :obj: `numpy.ndarray`): Repeated values of the
+            same type as preload. len() = num_simulation_steps.
         """
 
-    n = math.floor(num_simulation_steps / len(preload))
-
-    transformer_preload_repeated = preload * n
-
-    values_to_add = num_simulation_steps - len(transformer_preload_repeated)
+    assert len(preload) > 0, 'There must be at least one value to repeat.'
 
-    transformer_preload_repeated += preload[:values_to_add]
+    # np.resize fills the new array by repeating preload in one allocation, the last repetition
+    # is cut off at num_simulation_steps.
+    transformer_preload_repeated = np.resize(np.asarray(preload, dtype=np.float64),
+                                             num_simulation_steps)
 
-    return transformer_preload_repeated
+    if isinstance(preload, np.ndarray):
+        return transformer_preload_repeated
+    return transformer_preload_repeated.tolist()
 
 
 def floor(value, decimals=3):
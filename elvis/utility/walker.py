@@ -55,21 +55,29 @@ class WalkerRandomSampling(object):
         self.prob = weights
         self.inx = inx
 
-    def random(self, count=None):
+    def random(self, count=None, rng=None):
         """Returns a given number of random integers or keys, with probabilities
         being proportional to the weights supplied in the constructor.
 
         When `count` is ``None``, returns a single integer or key, otherwise
         returns a NumPy array with a length given in `count`.
+
+        When `rng` (a `numpy.random.Generator`) is given it is used instead of
+        the global random state.
         """
+        if rng is None:
+            uniform, integers = random, randint
+        else:
+            uniform, integers = rng.random, rng.integers
+
         if count is None:
-            u = random()
-            j = randint(self.n)
+            u = uniform()
+            j = integers(self.n)
             k = j if u <= self.prob[j] else self.inx[j]
             return self.keys[k] if self.keys is not None else k
 
-        u = random(count)
-        j = randint(self.n, size=count)
+        u = uniform(count)
+        j = integers(self.n, size=count)
         k = where(u <= self.prob[j], j, self.inx[j])
         return self.keys[k] if self.keys is not None else k
 
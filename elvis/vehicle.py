@@ -1,10 +1,20 @@
 """Class representing vehicle types. Especially in regard of their battery."""
+import functools
+import operator
+
 from elvis.battery import EVBattery
 
 
 class ElectricVehicle:
     """Models the charging behaviour of a specific EV model."""
 
+    STATE_FIELDS = ('brand', 'model', 'battery', 'probability')
+    # Returns the values of STATE_FIELDS as a tuple
+    _state = operator.attrgetter(*STATE_FIELDS)
+
+    # Keys from_dict can not do without
+    _REQUIRED_KEYS = frozenset(STATE_FIELDS)
+
     def __init__(self, brand: str, model: str, battery: EVBattery, probability):
         assert isinstance(battery, EVBattery)
         assert isinstance(probability, (float, int))
@@ -15,11 +25,16 @@ class ElectricVehicle:
         self.probability = probability
 
     def __str__(self):
-        printout = self.brand + ', ' + self.model
-        return printout
+        return f'{self.brand}, {self.model}'
+
+    def __getstate__(self):
+        return ElectricVehicle._state(self)
+
+    def __setstate__(self, state):
+        self.brand, self.model, self.battery, self.probability = state
 
     def to_dict(self):
-        dictionary = self.__dict__.copy()
+        dictionary = dict(zip(ElectricVehicle.STATE_FIELDS, ElectricVehicle._state(self)))
         dictionary['battery'] = self.battery.to_dict()
         return dictionary
 
@@ -32,11 +47,9 @@ class ElectricVehicle:
             **kwargs: Arbitrary keyword arguments.
         """
 
-        necessary_keys = ['brand', 'model', 'battery', 'probability']
-
-        for key in necessary_keys:
-            assert key in kwargs, 'Not all necessary keys are included to create a VehicleType ' \
-                                  'from dict.'
+        assert ElectricVehicle._REQUIRED_KEYS <= kwargs.keys(), \
+            'Not all necessary keys are included to create a VehicleType from dict. Missing: ' + \
+            ', '.join(sorted(ElectricVehicle._REQUIRED_KEYS - kwargs.keys()))
 
         brand = kwargs['brand']
         model = kwargs['model']
@@ -45,3 +58,29 @@ class ElectricVehicle:
 
         return ElectricVehicle(brand, model, battery, probability)
 
+    @staticmethod
+    def from_dict_interned(**kwargs):
+        """Initialise an instance of ElectricVehicle with values stored in a dict. Equal dicts
+            return the same (shared) instance, so many charging events of a few vehicle types
+            only reference a few vehicle and battery objects.
+
+        Args:
+
+            **kwargs: Arbitrary keyword arguments.
+        """
+        try:
+            key = tuple(sorted((name, value) for name, value in kwargs.items()
+                               if name != 'battery'))
+            key += (('battery', tuple(sorted(kwargs['battery'].items()))),)
+            return _interned_vehicle(key)
+        except (KeyError, AttributeError, TypeError):
+            # Incomplete or unhashable description: no sharing, let from_dict validate it
+            return ElectricVehicle.from_dict(**kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _interned_vehicle(key):
+    """Creates the shared instance of ElectricVehicle described by key (sorted dict items)."""
+    kwargs = dict(key)
+    kwargs['battery'] = dict(kwargs['battery'])
+    return ElectricVehicle.from_dict(**kwargs)
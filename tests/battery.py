@@ -0,0 +1,69 @@
+import os
+import sys
+sys.path.insert(1, os.path.join(sys.path[0], '..'))
+
+import datetime
+import unittest
+import numpy as np
+from elvis.battery import EVBattery, StationaryBattery
+
+
+class TestBattery(unittest.TestCase):
+    def test_max_power_possible_vec(self):
+        battery = EVBattery(50, 100, 0, 1, 0.8, 0.2)
+        socs = [0, 0.5, 0.8, 0.9, 1]
+        expected = [battery.max_power_possible(soc) for soc in socs]
+        result = EVBattery.max_power_possible_vec(socs, 100, 0.8, 0.2)
+        np.testing.assert_allclose(result, expected)
+
+        # No degradation at all
+        result = EVBattery.max_power_possible_vec(socs, 100, 1, 0)
+        np.testing.assert_allclose(result, [100] * len(socs))
+
+    def test_simulate_trace(self):
+        battery = StationaryBattery(capacity=10, max_charge_power=100, min_charge_power=0,
+                                    efficiency=1)
+        battery.set_step_hours(1)
+        battery.soc = 0.5
+
+        soc_trace = battery.simulate_trace([1, 2, -3])
+        np.testing.assert_allclose(soc_trace, [0.6, 0.8, 0.5])
+
+        # Saturation at both limits
+        soc_trace = battery.simulate_trace([4, 4, -2, -20, 1], step_hours=1)
+        np.testing.assert_allclose(soc_trace, [0.9, 1, 0.8, 0, 0.1])
+        # The battery itself is not changed
+        self.assertEqual(battery.soc, 0.5)
+
+        # Same result as charging step by step
+        battery.soc = 0
+        soc_trace = battery.simulate_trace([3, 3, 3, 3])
+        socs = []
+        for _ in range(4):
+            battery.charge(3, datetime.timedelta(hours=1))
+            socs.append(battery.soc)
+        np.testing.assert_allclose(soc_trace, socs)
+
+    def test_discharge_to_empty(self):
+        battery = StationaryBattery(capacity=13, max_charge_power=100, min_charge_power=0,
+                                    efficiency=1)
+        battery.set_step_hours(0.25)
+
+        # Emptying the battery at once with the returned limit, round-off used to take the SOC
+        # below 0
+        battery.soc = 0.03
+        battery.discharge(battery.max_discharge_power(0))
+        self.assertGreaterEqual(battery.soc, battery.min_soc)
+        self.assertAlmostEqual(battery.soc, 0, places=4)
+
+        # Step by step down to min_soc
+        battery.soc = 0.96
+        battery.min_soc = 0.1
+        for _ in range(10):
+            battery.discharge(min(battery.max_discharge_power(0), 7))
+            self.assertGreaterEqual(battery.soc, battery.min_soc)
+        self.assertAlmostEqual(battery.soc, battery.min_soc, places=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
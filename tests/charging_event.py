@@ -0,0 +1,56 @@
+import os
+import sys
+sys.path.insert(1, os.path.join(sys.path[0], '..'))
+
+import datetime
+import unittest
+from elvis.battery import EVBattery
+from elvis.charging_event import ChargingEvent
+from elvis.vehicle import ElectricVehicle
+
+
+class TestChargingEvent(unittest.TestCase):
+    def test_from_batch(self):
+        vehicle_types = [ElectricVehicle('VW', 'e-Up', EVBattery(36.8, 22, 0, 1), 0.5),
+                         ElectricVehicle('Tesla', 'S', EVBattery(100, 150, 0, 0.9), 0.5)]
+        arrival_times = [datetime.datetime(2020, 1, 1, 7, 15),
+                         datetime.datetime(2020, 1, 1, 23, 50),
+                         datetime.datetime(2020, 2, 29, 12)]
+        parking_times = [1.5, 0.3333, 10]
+        socs = [0.2, 0., 1.]
+        vehicle_type_ids = [1, 0, 1]
+
+        batch = ChargingEvent.build_batch(arrival_times, parking_times, socs, vehicle_type_ids)
+        events = ChargingEvent.from_batch(batch, vehicle_types)
+        expected = [ChargingEvent(arrival_time, parking_time, soc, vehicle_types[vehicle_type_id])
+                    for arrival_time, parking_time, soc, vehicle_type_id
+                    in zip(arrival_times, parking_times, socs, vehicle_type_ids)]
+
+        self.assertEqual(len(events), len(expected))
+        for event, expected_event in zip(events, expected):
+            self.assertEqual(event.arrival_time, expected_event.arrival_time)
+            self.assertEqual(event.parking_time, expected_event.parking_time)
+            self.assertEqual(event.leaving_time, expected_event.leaving_time)
+            self.assertEqual(event.soc, expected_event.soc)
+            self.assertEqual(event.soc_target, expected_event.soc_target)
+            self.assertIs(event.vehicle_type, expected_event.vehicle_type)
+            self.assertIsInstance(event.arrival_time, datetime.datetime)
+            self.assertIsInstance(event.soc, float)
+
+        # SOCs out of [0, 1] are rejected for the whole batch
+        with self.assertRaises(AssertionError):
+            ChargingEvent.build_batch(arrival_times, parking_times, [0.2, 1.1, 0.5],
+                                      vehicle_type_ids)
+
+    def test_dict_round_trip(self):
+        vehicle_type = ElectricVehicle('VW', 'e-Up', EVBattery(36.8, 22, 0, 1), 0.5)
+        event = ChargingEvent(datetime.datetime(2020, 1, 1, 7, 15), 1.5, 0.2, vehicle_type)
+
+        # to_dict stores the arrival time as ISO string
+        loaded = ChargingEvent.from_dict(**event.to_dict())
+        self.assertEqual(loaded.arrival_time, event.arrival_time)
+        self.assertEqual(loaded.leaving_time, event.leaving_time)
+        self.assertEqual(loaded.to_dict()['vehicle_type'], event.to_dict()['vehicle_type'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+import os
+import sys
+sys.path.insert(1, os.path.join(sys.path[0], '..'))
+
+import datetime
+import gzip
+import json
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from elvis.config import ScenarioConfig, ScenarioRealisation
+from elvis.set_up_infrastructure import wallbox_infrastructure
+
+
+def _config():
+    config = ScenarioConfig()
+    config.with_infrastructure(wallbox_infrastructure(4, 11., power_transformer=30.))
+    config.with_scheduling_policy('UC')
+    config.with_num_charging_events(10)
+    config.with_queue_length(2)
+    config.with_disconnect_by_time(True)
+    config.with_mean_park(5)
+    config.with_std_deviation_park(1)
+    config.with_mean_soc(0.5)
+    config.with_std_deviation_soc(0.1)
+    config.with_arrival_distribution([1.] * 168)
+    config.add_vehicle_types(brand='VW', model='e-Up', probability=1,
+                             battery={'capacity': 36.8, 'max_charge_power': 22,
+                                      'min_charge_power': 0, 'efficiency': 1})
+    return config
+
+
+class TestScenarioConfig(unittest.TestCase):
+    def test_json_with_res_data(self):
+        config = _config()
+        config.with_transformer_preload([1., 2., 3.], res_data=datetime.timedelta(minutes=15),
+                                        repeat=True)
+        config.with_emissions_scenario([4., 5.], res_data=datetime.timedelta(hours=1))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'config.json')
+            config.to_json(path)
+            loaded = ScenarioConfig.from_json(path)
+
+        self.assertEqual(loaded.transformer_preload_res_data, datetime.timedelta(minutes=15))
+        self.assertEqual(loaded.emissions_scenario_res_data, datetime.timedelta(hours=1))
+        # from_dict sets the default df_charging_period
+        expected = dict(config.to_dict(), df_charging_period='0:15:00')
+        self.assertEqual(loaded.to_dict(), expected)
+
+    def test_json_with_pandas(self):
+        config = _config()
+        config.with_transformer_preload(pd.Series([1., 2., 3.]), res_data='00:15:00', repeat=True)
+        config.with_emissions_scenario(pd.DataFrame({'a': [1., 2.], 'b': [3., 4.]}), col_pos=1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'config.json')
+            config.to_json(path)
+            loaded = ScenarioConfig.from_json(path)
+
+        # A Series is stored as list, a DataFrame as dict of columns
+        np.testing.assert_array_equal(loaded.transformer_preload, [1., 2., 3.])
+        pd.testing.assert_frame_equal(loaded.emissions_scenario, config.emissions_scenario)
+        self.assertEqual(loaded.emissions_scenario_col_pos, 1)
+        expected = dict(config.to_dict(), df_charging_period='0:15:00')
+        self.assertEqual(loaded.to_dict(), expected)
+
+    def test_yaml_with_res_data(self):
+        config = _config()
+        config.with_transformer_preload([1., 2., 3.], res_data=datetime.timedelta(minutes=15),
+                                        repeat=True)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'config.yaml')
+            config.to_yaml(path)
+            loaded = ScenarioConfig.from_yaml_file(path)
+
+        self.assertEqual(loaded.transformer_preload_res_data, datetime.timedelta(minutes=15))
+        expected = dict(config.to_dict(), df_charging_period='0:15:00')
+        self.assertEqual(loaded.to_dict(), expected)
+
+    def test_yaml_with_pandas(self):
+        config = _config()
+        config.with_transformer_preload(pd.Series([1., 2.]))
+        config.with_emissions_scenario(pd.DataFrame({'a': [1., 2.], 'b': [3., 4.]}))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'config.yaml')
+            # The safe dumper only writes plain types
+            config.to_yaml(path)
+            loaded = ScenarioConfig.from_yaml_file(path)
+
+        np.testing.assert_array_equal(loaded.transformer_preload, [1., 2.])
+        pd.testing.assert_frame_equal(loaded.emissions_scenario, config.emissions_scenario)
+        expected = dict(config.to_dict(), df_charging_period='0:15:00')
+        self.assertEqual(loaded.to_dict(), expected)
+
+    def test_from_dict_unknown_key(self):
+        dictionary = _config().to_dict()
+        ScenarioConfig.from_dict(dictionary)
+
+        dictionary['mean_prak'] = 5
+        with self.assertRaises(AssertionError):
+            ScenarioConfig.from_dict(dictionary)
+
+    def test_create_realisations(self):
+        config = _config()
+        config.with_transformer_preload(0)
+        time_params = ('2020-01-01 00:00:00', '2020-01-07 23:45:00', '00:15:00')
+
+        def arrivals(realisations):
+            return [[event.arrival_time for event in realisation.charging_events]
+                    for realisation in realisations]
+
+        realisations = config.create_realisations(3, *time_params, seed=7, max_workers=3)
+        # Reproducible for a fixed seed, independent of the number of processes
+        self.assertEqual(arrivals(config.create_realisations(3, *time_params, seed=7,
+                                                             max_workers=1)),
+                         arrivals(realisations))
+
+        # Every realisation samples its own charging events
+        self.assertEqual(len(set(map(tuple, arrivals(realisations)))), 3)
+        events = [event for realisation in realisations for event in realisation.charging_events]
+        self.assertEqual(len(set(events)), len(events))
+
+
+class TestScenarioRealisation(unittest.TestCase):
+    def test_from_dict(self):
+        config = _config()
+        config.with_transformer_preload(0)
+        realisation = config.create_realisation('2020-01-01 00:00:00', '2020-01-07 23:45:00',
+                                                '00:15:00')
+        realisation.sample_method = 'gmm'
+
+        loaded = ScenarioRealisation.from_dict(realisation.to_dict())
+        self.assertEqual(loaded.sample_method, 'gmm')
+        self.assertEqual(len(loaded.charging_events), len(realisation.charging_events))
+    def test_save_to_disk(self):
+        config = _config()
+        config.with_transformer_preload(0)
+        realisation = config.create_realisation('2020-01-01 00:00:00', '2020-01-07 23:45:00',
+                                                '00:15:00')
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'realisation.json.gz')
+            realisation.save_to_disk(path)
+            # A single JSON document, as written by earlier versions
+            with gzip.open(path, 'rt', encoding='utf-8') as fin:
+                data = json.load(fin)
+            loaded = ScenarioRealisation.from_disk(path)
+
+        self.assertEqual(data, realisation.to_dict())
+
+        # Event ids are counted up on creation
+        def without_ids(dictionary):
+            for charging_event in dictionary['charging_events']:
+                del charging_event['id']
+            return dictionary
+
+        self.assertEqual(without_ids(loaded.to_dict()), without_ids(realisation.to_dict()))
+
+if __name__ == '__main__':
+    unittest.main()
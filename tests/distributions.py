@@ -3,6 +3,7 @@ import sys
 sys.path.insert(1, os.path.join(sys.path[0], '..'))
 
 import unittest
+import numpy
 import elvis.distribution
 
 class TestDistributions(unittest.TestCase):
@@ -23,5 +24,11 @@ class TestDistributions(unittest.TestCase):
         self.assertEqual(dist[-1], 0)
         self.assertEqual(dist[120], 9)
 
+    def test_linear_vectorized(self):
+        dist = elvis.distribution.EquallySpacedInterpolatedDistribution.linear([[0, 0], [1, 2], [2, 4], [3, 9]], [0, 3])
+        xs = [-1, 0, 0.5, 1.25, 2.5, 3, 120]
+        self.assertEqual(list(dist(xs)), [dist[x] for x in xs])
+        self.assertEqual(list(dist[numpy.array(xs)]), list(dist(xs)))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,51 @@
+import os
+import sys
+sys.path.insert(1, os.path.join(sys.path[0], '..'))
+
+import datetime
+import unittest
+import numpy as np
+import pandas as pd
+from elvis.utility.elvis_general import adjust_resolution, repeat_data
+
+MINUTE = datetime.timedelta(minutes=1)
+
+
+class TestElvisGeneral(unittest.TestCase):
+    def test_adjust_resolution(self):
+        # Expected values as returned by the former list based implementation
+        result = adjust_resolution([1., 4., 2., 0.], 60 * MINUTE, 15 * MINUTE)
+        np.testing.assert_allclose(result, [1., 1.75, 2.5, 3.25, 4., 3.5, 3., 2.5, 2., 1.5, 1.,
+                                            0.5, 0., 0., 0., 0.])
+        self.assertIsInstance(result, list)
+
+        result = adjust_resolution([1., 4., 2., 0., 3.], 15 * MINUTE, 45 * MINUTE)
+        np.testing.assert_allclose(result, [1., 0.])
+
+        result = adjust_resolution(np.array([1., 3.]), 60 * MINUTE, 25 * MINUTE)
+        np.testing.assert_allclose(result, [1., 1.8333333333333335, 2.666666666666667, 3., 3.])
+        self.assertIsInstance(result, np.ndarray)
+
+        # Same resolution
+        self.assertEqual(adjust_resolution([1, 2], MINUTE, MINUTE), [1, 2])
+
+    def test_adjust_resolution_data_frame(self):
+        data = pd.DataFrame({'a': [1., 4., 2., 0.], 'b': [0., 1., 3., 5.]})
+        result = adjust_resolution(data, 60 * MINUTE, 25 * MINUTE)
+
+        self.assertListEqual(list(result.columns), ['a', 'b'])
+        for column in data:
+            np.testing.assert_allclose(result[column], adjust_resolution(
+                data[column].tolist(), 60 * MINUTE, 25 * MINUTE))
+
+    def test_repeat_data(self):
+        self.assertEqual(repeat_data([1., 2., 3.], 7), [1., 2., 3., 1., 2., 3., 1.])
+        self.assertEqual(repeat_data([1., 2., 3.], 2), [1., 2.])
+        np.testing.assert_array_equal(repeat_data(np.array([5.]), 3), [5., 5., 5.])
+
+        with self.assertRaises(AssertionError):
+            repeat_data([], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+import os
+import sys
+sys.path.insert(1, os.path.join(sys.path[0], '..'))
+
+import unittest
+import numpy as np
+from elvis.set_up_infrastructure import set_up_infrastructure, wallbox_infrastructure
+
+
+class TestInfrastructure(unittest.TestCase):
+    def test_headrooms(self):
+        infrastructure = wallbox_infrastructure(4, 11., num_cp_per_cs=2, power_transformer=30.)
+        charging_points = set_up_infrastructure(infrastructure)
+        transformer = charging_points[0].get_transformer()
+        charging_stations = [cp.parent for cp in charging_points[::2]]
+
+        power_assigned = np.array([1., 2., 3., 4.])
+        expected = [transformer.max_hardware_power(power_assigned, 0)]
+        expected += [cs.max_hardware_power(power_assigned) for cs in charging_stations]
+        np.testing.assert_allclose(transformer.headrooms(power_assigned), expected)
+        np.testing.assert_allclose(transformer.headrooms(), [30, 22, 22])
+
+
+if __name__ == '__main__':
+    unittest.main()